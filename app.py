@@ -1,18 +1,42 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, Query
-from fastapi.responses import RedirectResponse, HTMLResponse, FileResponse
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import RedirectResponse, HTMLResponse, FileResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 import os
 
+from utils import codec
 from utils.dates import today_yyyymmdd_eastern
+from utils.etag import json_response
+from services import cache_janitor, cache_sqlite, refresher, slate_versions, upstream
 from services.espn import urls_by_event_id
-from services.build import build_games_for_date
-from services.pga_espn import get_pga_leaderboard
-
-app = FastAPI()
+from routers.stream import router as stream_router
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep today's slates hot in memory; set SLATE_REFRESHER=0 to serve every request synchronously.
+    if os.getenv("SLATE_REFRESHER", "1") == "1":
+        refresher.start()
+    # Expired-row purge, size cap and idle vacuum for cache.sqlite3; CACHE_JANITOR=0 disables it.
+    if os.getenv("CACHE_JANITOR", "1") == "1":
+        cache_janitor.start()
+    try:
+        yield
+    finally:
+        refresher.stop()
+        cache_janitor.stop()
+        upstream.close()
+        cache_sqlite.close_all()
+
+class CodecJSONResponse(JSONResponse):
+    """Default response class: encodes through utils.codec (orjson when installed)."""
+    def render(self, content) -> bytes:
+        return codec.dumps(content)
+
+app = FastAPI(lifespan=lifespan, default_response_class=CodecJSONResponse)
 
 # Version management (read once at startup)
 VERSION_PATH = Path(__file__).with_name("version.txt")
@@ -117,40 +141,70 @@ def get_version():
 
 # ---- UI contract endpoints ----
 
+# Data endpoints answer with a strong ETag and 304 on a matching If-None-Match (utils/etag.py).
+
 @app.get("/urls/espn")
-def urls_espn(date_espn: str | None = Query(default=None), sport: str | None = Query(default="cbb")):
+def urls_espn(request: Request, date_espn: str | None = Query(default=None), sport: str | None = Query(default="cbb")):
     date_espn = date_espn or today_yyyymmdd_eastern()
     sport = (sport or "cbb").lower()
     m = urls_by_event_id(date_espn, sport)
     # Keep extra fields if you want; UI ignores them.
-    return {"date_espn": date_espn, "sport": sport, "count": len(m), "urls_by_event_id": m}
+    return json_response(request, {"date_espn": date_espn, "sport": sport, "count": len(m), "urls_by_event_id": m})
 
 @app.get("/games")
 def games(
+    request: Request,
     date_espn: str | None = Query(default=None),
     date_kp: str | None = Query(default=None),
     sport: str | None = Query(default="cbb"),
+    since: int | None = Query(default=None),
 ):
     date_espn = date_espn or today_yyyymmdd_eastern()
     date_kp = date_kp or date_espn
-    return build_games_for_date(date_espn, date_kp, sport.lower() if sport else "cbb")
+    sport = sport.lower() if sport else "cbb"
+    payload = refresher.read_games(date_espn, date_kp, sport)
+    if since is None:
+        return json_response(request, payload)
+
+    # ?since=<version>: only games that changed plus removed event ids (full payload if since is unknown)
+    d = slate_versions.delta(sport, date_espn, payload.get("games") or [], "event_id", since)
+    if d is None:
+        return json_response(request, payload)
+    out = {k: v for k, v in payload.items() if k != "games"}
+    out.update({"version": d["version"], "since": since, "delta": True, "games": d["games"], "removed": d["removed"]})
+    return json_response(request, out)
+
+# Server-Sent Events: /games/stream and /mlb/games/stream
+app.include_router(stream_router)
 
 # Optional: mount debug routes only when DEBUG=1
 if os.getenv("DEBUG", "0") == "1":
     from routers.debug import router as debug_router
     app.include_router(debug_router)
 
-from services.mlb_espn import get_mlb_games
-
 @app.get("/mlb/games")
-def mlb_games(date: str):
-    return {
+def mlb_games(request: Request, date: str, since: int | None = Query(default=None)):
+    games = refresher.read_mlb_games(date)
+    if since is not None:
+        d = slate_versions.delta("mlb", date, games, "id", since)
+        if d is not None:
+            return json_response(request, {"date": date, "version": d["version"], "since": since, "delta": True, "games": d["games"], "removed": d["removed"]})
+    return json_response(request, {
         "date": date,
-        "games": get_mlb_games(date)
-    }
+        "version": slate_versions.stamp("mlb", date, games, "id"),
+        "games": games
+    })
+
+
+@app.get("/mlb/games/{event_id}/live")
+def mlb_game_live(request: Request, event_id: str):
+    live = refresher.read_mlb_live_game(event_id)
+    if live is None:
+        raise HTTPException(status_code=404, detail=f"Unknown MLB event: {event_id}")
+    return json_response(request, live)
 
 
 @app.get("/pga/leaderboard")
-def pga_leaderboard(date: str | None = Query(default=None), limit: int = Query(default=0, ge=0, le=500)):
+def pga_leaderboard(request: Request, date: str | None = Query(default=None), limit: int = Query(default=0, ge=0, le=500)):
     # limit=0 means no limit (display full field)
-    return get_pga_leaderboard(date_yyyymmdd=date, limit=limit)
+    return json_response(request, refresher.read_pga_leaderboard(date, limit))
@@ -0,0 +1,81 @@
+# bench/cache_sqlite_bench.py
+"""
+Hit-path latency of cache_sqlite.get_cached: connection per call (the previous
+_db(), which connected, ran both pragmas and closed on every call) vs the
+persistent per-thread connection. Both read and decode the row from SQLite
+(the L1 is disabled for them); "l1" is the in-process hit for reference.
+
+Usage (from the repo root):
+  python -m bench.cache_sqlite_bench [--rounds 2000]
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from bench import fixtures
+from services import cache_sqlite
+
+
+def _get_connect_per_call(cache_key: str, db_path: str):
+    conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL;")
+        conn.execute("PRAGMA synchronous=NORMAL;")
+        row = conn.execute(
+            "SELECT status_code, payload_json, payload_blob, codec, fetched_at, expires_at FROM http_cache WHERE cache_key=?",
+            (cache_key,),
+        ).fetchone()
+        conn.commit()
+    finally:
+        conn.close()
+    status_code, payload_json, payload_blob, codec_tag, fetched_at, expires_at = row
+    return status_code, cache_sqlite._decode_payload(payload_json, payload_blob, codec_tag), fetched_at, expires_at
+
+
+def _wall_us(fn, rounds: int) -> list[float]:
+    fn()
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rounds", type=int, default=2000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.sqlite3")
+        cache_sqlite.init_cache(db_path)
+        key = "kenpom:fanmatch:d=2026-02-07"
+        cache_sqlite.set_cached(key, 200, fixtures.kenpom_rows(fixtures.cbb_scoreboard()), 3600, db_path=db_path)
+
+        l1_max = cache_sqlite.L1_MAX_BYTES
+        cache_sqlite.L1_MAX_BYTES = 0  # every get_cached goes to SQLite
+        with cache_sqlite._l1_lock:
+            cache_sqlite._l1.clear()
+            cache_sqlite._l1_bytes = 0
+        runs = {
+            "connect-per-call": _wall_us(lambda: _get_connect_per_call(key, db_path), args.rounds),
+            "persistent": _wall_us(lambda: cache_sqlite.get_cached(key, db_path), args.rounds),
+        }
+        cache_sqlite.L1_MAX_BYTES = l1_max
+        runs["l1"] = _wall_us(lambda: cache_sqlite.get_cached(key, db_path), args.rounds)
+        cache_sqlite.close_all()
+
+    print(f"get_cached hit path, 150-row fanmatch payload, rounds={args.rounds}")
+    print(f"{'mode':<18} {'p50 us':>10} {'p95 us':>10} {'mean us':>10}")
+    for name, s in runs.items():
+        p50 = s[len(s) // 2]
+        p95 = s[int(len(s) * 0.95)]
+        print(f"{name:<18} {p50:>10.1f} {p95:>10.1f} {sum(s) / len(s):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# bench/codec_bench.py
+"""
+Per-request JSON CPU for a 150-game /games request: stdlib json vs utils.codec.
+
+Stages measured (CPU time via time.process_time):
+  decode    ESPN scoreboard body (limit=500 style payload)
+  cache     KenPom fanmatch payload round-trip through the cache encoding
+  respond   encoding the merged /games payload (old path: jsonable_encoder + json.dumps)
+
+Usage (from the repo root):
+  python -m bench.codec_bench [--scoreboard recorded_scoreboard.json] [--rounds 200]
+"""
+import argparse
+import json
+import time
+
+from fastapi.encoders import jsonable_encoder
+
+from bench import fixtures
+from services.espn import parse_games
+from utils import codec
+
+
+def _cpu_us(fn, rounds: int) -> float:
+    fn()  # warm-up
+    start = time.process_time()
+    for _ in range(rounds):
+        fn()
+    return (time.process_time() - start) / rounds * 1e6
+
+
+def _games_payload(scoreboard: dict, kp_rows: list[dict]) -> dict:
+    games = []
+    for e, kp in zip(parse_games(scoreboard), kp_rows):
+        g = dict(e)
+        g.update({"kp_found": True, "kp_game_id": kp["GameID"], "kp_home_pred": kp["HomePred"],
+                  "kp_away_pred": kp["VisitorPred"], "kp_home_wp": kp["HomeWP"], "kp_thrill": kp["ThrillScore"],
+                  "kp_pred_tempo": kp["PredTempo"], "kp_home_rank": kp["HomeRank"], "kp_away_rank": kp["VisitorRank"]})
+        games.append(g)
+    return {"date_espn": "20260207", "date_kp": "2026-02-07", "count": len(games), "games": games}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--scoreboard", help="recorded ESPN scoreboard JSON file")
+    ap.add_argument("--rounds", type=int, default=200)
+    args = ap.parse_args()
+
+    scoreboard = fixtures.load_json(args.scoreboard, fixtures.cbb_scoreboard)
+    kp_rows = fixtures.kenpom_rows(scoreboard)
+    payload = _games_payload(scoreboard, kp_rows)
+    sb_bytes = json.dumps(scoreboard).encode("utf-8")
+    kp_text = json.dumps(kp_rows, separators=(",", ":"))
+
+    stages = {
+        "decode": (
+            lambda: json.loads(sb_bytes),
+            lambda: codec.loads(sb_bytes),
+        ),
+        "cache": (
+            lambda: json.loads(json.dumps(kp_rows, separators=(",", ":"))),
+            lambda: codec.loads(codec.dumps_str(kp_rows)),
+        ),
+        "cache-hit": (
+            lambda: json.loads(kp_text),
+            lambda: codec.loads(kp_text),
+        ),
+        "respond": (
+            lambda: json.dumps(jsonable_encoder(payload), ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+            lambda: codec.dumps(payload),
+        ),
+    }
+
+    print(f"events={len(scoreboard.get('events') or [])} scoreboard_bytes={len(sb_bytes)} "
+          f"kenpom_rows={len(kp_rows)} codec={codec.BACKEND} rounds={args.rounds}")
+    print(f"{'stage':<10} {'stdlib us':>12} {'codec us':>12} {'saved us':>12} {'speedup':>8}")
+    total_old = total_new = 0.0
+    for name, (old, new) in stages.items():
+        t_old = _cpu_us(old, args.rounds)
+        t_new = _cpu_us(new, args.rounds)
+        if name != "cache-hit":  # cache-hit is the read half of "cache"; don't double count
+            total_old += t_old
+            total_new += t_new
+        print(f"{name:<10} {t_old:>12.1f} {t_new:>12.1f} {t_old - t_new:>12.1f} {t_old / t_new:>7.1f}x")
+    print(f"{'request':<10} {total_old:>12.1f} {total_new:>12.1f} {total_old - total_new:>12.1f} {total_old / total_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# bench/fixtures.py
+"""
+Slate fixtures for the benchmarks in this folder.
+
+Pass a recorded upstream body (e.g. saved from the ESPN scoreboard with
+limit=500) with --scoreboard to benchmark against real data. Without one, a
+synthetic 150-game CBB Saturday with ESPN-shaped events is generated; it is
+deterministic so runs are comparable.
+"""
+import json
+import random
+from pathlib import Path
+
+
+def team_names(n: int = 362) -> list[str]:
+    rng = random.Random(7)
+    stems = ["North", "South", "East", "West", "Central", "Saint", "Mount", "Lake", "River", "Coastal"]
+    kinds = ["State", "Tech", "A&M", "University", "College", "Christian", "Southern", ""]
+    out = []
+    for i in range(n):
+        name = f"{rng.choice(stems)} {chr(65 + i % 26)}{chr(97 + (i // 26) % 26)}ville {rng.choice(kinds)}".strip()
+        out.append(name)
+    return out
+
+
+def _competitor(team_id: int, name: str, side: str, score: int, rng: random.Random) -> dict:
+    return {
+        "id": str(team_id),
+        "uid": f"s:40~l:41~t:{team_id}",
+        "type": "team",
+        "order": 0 if side == "home" else 1,
+        "homeAway": side,
+        "winner": False,
+        "score": str(score),
+        "team": {
+            "id": str(team_id),
+            "uid": f"s:40~l:41~t:{team_id}",
+            "location": name,
+            "name": "Mascots",
+            "abbreviation": name[:4].upper(),
+            "displayName": f"{name} Mascots",
+            "shortDisplayName": name,
+            "color": "003366",
+            "alternateColor": "ffffff",
+            "isActive": True,
+            "venue": {"id": str(rng.randint(1, 9999))},
+            "links": [{"rel": ["clubhouse", "desktop", "team"], "href": f"https://www.espn.com/team/_/id/{team_id}", "text": "Clubhouse"}],
+            "logo": f"https://a.espncdn.com/i/teamlogos/ncaa/500/{team_id}.png",
+            "conferenceId": str(rng.randint(1, 50)),
+        },
+        "linescores": [{"value": float(score // 2)}, {"value": float(score - score // 2)}],
+        "statistics": [
+            {"name": stat, "abbreviation": stat[:3].upper(), "displayValue": f"{rng.random() * 100:.1f}"}
+            for stat in ("rebounds", "avgRebounds", "assists", "fieldGoalsAttempted", "fieldGoalsMade",
+                         "fieldGoalPct", "freeThrowPct", "freeThrowsAttempted", "freeThrowsMade", "points")
+        ],
+        "records": [{"name": "overall", "abbreviation": "Game", "type": "total", "summary": f"{rng.randint(5, 20)}-{rng.randint(2, 12)}"}],
+    }
+
+
+def cbb_scoreboard(n_games: int = 150, seed: int = 1) -> dict:
+    rng = random.Random(seed)
+    names = team_names(2 * n_games)
+    events = []
+    for i in range(n_games):
+        state = rng.choice(["pre", "in", "post"])
+        comp = {
+            "id": str(401700000 + i),
+            "date": "2026-02-07T17:00Z",
+            "startDate": "2026-02-07T17:00Z",
+            "attendance": rng.randint(1000, 15000),
+            "neutralSite": False,
+            "venue": {"id": str(rng.randint(1, 9999)), "fullName": f"Arena {i}", "address": {"city": "Somewhere", "state": "NC"}},
+            "competitors": [
+                _competitor(2 * i + 1, names[2 * i + 1], "home", rng.randint(40, 90), rng),
+                _competitor(2 * i, names[2 * i], "away", rng.randint(40, 90), rng),
+            ],
+            "status": {
+                "clock": float(rng.randint(0, 1200)),
+                "displayClock": "10:00",
+                "period": rng.randint(1, 2),
+                "type": {"id": "2", "name": "STATUS_IN_PROGRESS", "state": state, "completed": state == "post",
+                         "description": "In Progress", "detail": "2nd Half - 10:00", "shortDetail": "10:00 - 2nd"},
+            },
+            "broadcasts": [{"market": "national", "names": ["ESPN2"]}],
+            "geoBroadcasts": [{"type": {"id": "1", "shortName": "TV"}, "market": {"id": "1", "type": "National"},
+                               "media": {"shortName": "ESPN2"}, "lang": "en", "region": "us"}],
+            "odds": [{"provider": {"id": "58", "name": "ESPN BET"}, "details": "HOME -4.5", "overUnder": 141.5}],
+        }
+        events.append({
+            "id": str(401700000 + i),
+            "uid": f"s:40~l:41~e:{401700000 + i}",
+            "date": "2026-02-07T17:00Z",
+            "name": f"{names[2 * i]} at {names[2 * i + 1]}",
+            "shortName": f"{names[2 * i][:4].upper()} @ {names[2 * i + 1][:4].upper()}",
+            "competitions": [comp],
+            "links": [{"rel": ["summary", "desktop", "event"], "href": f"https://www.espn.com/game/_/gameId/{401700000 + i}"}],
+        })
+    return {"leagues": [{"id": "41", "name": "NCAA Men's Basketball"}], "events": events}
+
+
+def kenpom_rows(scoreboard: dict) -> list[dict]:
+    rng = random.Random(2)
+    rows = []
+    for i, ev in enumerate(scoreboard.get("events") or []):
+        comps = ev["competitions"][0]["competitors"]
+        home = next(c for c in comps if c["homeAway"] == "home")["team"]["shortDisplayName"]
+        away = next(c for c in comps if c["homeAway"] == "away")["team"]["shortDisplayName"]
+        rows.append({
+            "Season": 2026, "GameID": i + 1, "DateOfGame": "2026-02-07",
+            "Visitor": away, "Home": home,
+            "VisitorRank": rng.randint(1, 362), "HomeRank": rng.randint(1, 362),
+            "VisitorPred": round(rng.uniform(55, 85), 1), "HomePred": round(rng.uniform(55, 85), 1),
+            "HomeWP": round(rng.uniform(5, 95), 1), "PredTempo": round(rng.uniform(62, 74), 1),
+            "ThrillScore": round(rng.uniform(20, 80), 1),
+        })
+    return rows
+
+
+def load_json(path: str | None, fallback):
+    if path:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    return fallback()
+
+
+def mlb_summary(state: str = "in", seed: int = 5) -> dict:
+    """ESPN-shaped MLB summary (boxscore, plays, news, odds) for a pre, in or post game."""
+    rng = random.Random(seed)
+
+    def athlete(pid: int) -> dict:
+        return {"id": str(pid), "displayName": f"Player {pid}", "shortName": f"P. {pid}",
+                "headshot": {"href": f"https://a.espncdn.com/i/headshots/mlb/players/full/{pid}.png"},
+                "jersey": str(pid % 99), "position": {"abbreviation": "P" if pid % 10 == 0 else "IF"}}
+
+    def team_box(team_id: int, base: int) -> dict:
+        batting = [{"active": False, "starter": i < 9, "athlete": athlete(base + i),
+                    "stats": [str(rng.randint(0, 4)) for _ in range(10)]} for i in range(13)]
+        pitching = [{"active": i == 2, "athlete": athlete(base + 50 + i),
+                     "stats": [f"{rng.randint(0, 6)}.{rng.randint(0, 2)}"] + [str(rng.randint(0, 9)) for _ in range(8)]}
+                    for i in range(5)]
+        return {"team": {"id": str(team_id), "abbreviation": f"T{team_id}"},
+                "statistics": [{"type": "batting", "names": ["AB", "R", "H"], "athletes": batting},
+                               {"type": "pitching", "names": ["IP", "H", "ER"], "athletes": pitching}]}
+
+    played = state != "pre"
+    plays = [{"id": str(4000 + i), "type": {"id": "59", "text": "Pitch"}, "text": f"Pitch {i}: ball",
+              "period": {"type": "Top" if i % 2 else "Bottom", "number": 1 + i // 40},
+              "participants": [{"athlete": {"id": str(100 + i % 13)}, "type": "batter"}],
+              "pitchCoordinate": {"x": rng.randint(0, 200), "y": rng.randint(0, 200)}}
+             for i in range(320 if played else 0)]
+    status_type = {"pre": {"state": "pre", "detail": "Scheduled"},
+                   "in": {"state": "in", "detail": "Top 6th"},
+                   "post": {"state": "post", "detail": "Final"}}[state]
+    status = {"type": status_type}
+    if state == "post":
+        status["featuredAthletes"] = [
+            {"name": "winningPitcher", "athlete": {"displayName": "Player 152", "record": "8-3"}, "team": {"id": "1", "name": "Home"}},
+            {"name": "losingPitcher", "athlete": {"displayName": "Player 252", "record": "4-7"}, "team": {"id": "2", "name": "Away"}},
+        ]
+    competitors = [
+        {"homeAway": "home", "team": {"id": "1", "displayName": "Home"}, "score": "4" if played else None,
+         "probables": [{"playerId": 150, "athlete": athlete(150), "statistics": []}]},
+        {"homeAway": "away", "team": {"id": "2", "displayName": "Away"}, "score": "3" if played else None,
+         "probables": [{"playerId": 250, "athlete": athlete(250), "statistics": []}]},
+    ]
+    summary = {
+        "boxscore": {"teams": [{"team": {"id": "1"}}, {"team": {"id": "2"}}],
+                     "players": [team_box(1, 100), team_box(2, 200)] if played else []},
+        "gameInfo": {"venue": {"fullName": "Ballpark"}, "attendance": 30000},
+        "plays": plays,
+        "news": {"articles": [{"headline": f"Story {i}", "description": "x" * 200} for i in range(10)]},
+        "odds": [{"provider": {"name": "ESPN BET"}, "details": "HOME -150", "overUnder": 8.5}],
+        "header": {"id": "401", "competitions": [{"status": status, "competitors": competitors}]},
+    }
+    if state == "in":
+        summary["situation"] = {"balls": 1, "strikes": 2, "outs": 1, "onFirst": True,
+                                "batter": {"playerId": "205"}, "pitcher": {"playerId": "152"},
+                                "dueUp": [{"playerId": "206"}, {"playerId": "207"}], "lastPlay": {"id": "4319"}}
+    return summary
+
+
+def pga_competitors(n: int = 156, seed: int = 7) -> list[dict]:
+    """ESPN-shaped golf competitors mid-round 3: per-round linescores with hole-by-hole scores and tee times."""
+    rng = random.Random(seed)
+    comps = []
+    for i in range(n):
+        rounds = []
+        for period in (1, 2, 3):
+            holes = 18 if period < 3 else rng.randint(0, 18)
+            strokes = [{"value": rng.choice((3, 4, 4, 4, 5)), "period": h + 1} for h in range(holes)]
+            rounds.append({
+                "period": period,
+                "value": sum(h["value"] for h in strokes),
+                "displayValue": str(rng.randint(-5, 4)),
+                "linescores": strokes,
+                "statistics": {"categories": [{"stats": [{"displayValue": f"Sat Jul 18 {7 + i % 8:02d}:{i % 6}0:00 EDT 2026"}]}]},
+            })
+        comps.append({
+            "id": str(9000 + i), "order": i + 1, "score": str(rng.randint(-12, 6)),
+            "athlete": {"id": str(9000 + i), "displayName": f"Golfer {i}", "shortName": f"G. {i}",
+                        "flag": {"alt": "USA", "href": "https://a.espncdn.com/i/teamlogos/countries/500/usa.png"}},
+            "linescores": rounds,
+        })
+    return comps
+
+
+def pga_tick(competitors: list[dict], moved: int, rng: random.Random) -> None:
+    """Advance `moved` golfers by one hole in round 3 (in place), as between two polls."""
+    for comp in rng.sample(competitors, moved):
+        r3 = comp["linescores"][2]
+        if len(r3["linescores"]) >= 18:
+            continue
+        stroke = rng.choice((3, 4, 4, 4, 5))
+        r3["linescores"].append({"value": stroke, "period": len(r3["linescores"]) + 1})
+        r3["value"] += stroke
+        comp["score"] = str(int(comp["score"]) + stroke - 4)
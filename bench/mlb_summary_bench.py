@@ -0,0 +1,116 @@
+# bench/mlb_summary_bench.py
+"""
+MLB summary extraction: the previous recursive walks vs services.mlb_espn._extract_summary.
+
+The old path ran three separate passes per summary fetch: a recursive search of
+the whole document for probables (boxscore, plays, news and odds included, even
+after both were found), a boxscore walk for player names, and a second boxscore
+walk for the active pitcher. The new path reads the known ESPN paths once and
+only walks the document when a probable is still missing.
+
+Usage (from the repo root):
+  python -m bench.mlb_summary_bench [--pre pre.json --live live.json --final final.json] [--rounds 500]
+"""
+import argparse
+import time
+from typing import Any
+
+from bench import fixtures
+from services import mlb_espn
+
+
+# ---- previous implementation (kept here for comparison only) ----
+def _old_find_probables(obj: Any) -> dict:
+    out = {"home": None, "away": None}
+
+    def _recurse(o: Any, side_ctx=None) -> None:
+        if isinstance(o, dict):
+            next_side_ctx = side_ctx
+            o_side = o.get("homeAway") or o.get("homeaway")
+            if o_side in ("home", "away"):
+                next_side_ctx = o_side
+            for k, v in o.items():
+                if not k:
+                    continue
+                if str(k).lower() in mlb_espn._PROBABLE_KEYS:
+                    mlb_espn._take_probables(v, next_side_ctx, out)
+                _recurse(v, next_side_ctx)
+        elif isinstance(o, list):
+            for i in o:
+                _recurse(i, side_ctx)
+
+    _recurse(obj)
+    return out
+
+
+def _old_player_names(summary: dict) -> dict:
+    out = {}
+    for team_group in (summary.get("boxscore") or {}).get("players") or []:
+        for stat_group in team_group.get("statistics") or []:
+            for row in stat_group.get("athletes") or []:
+                athlete = row.get("athlete") or {}
+                pid = athlete.get("id")
+                name = athlete.get("displayName") or athlete.get("fullName") or athlete.get("shortName")
+                if pid and name:
+                    out[str(pid)] = str(name)
+    return out
+
+
+def _old_active_pitchers(summary: dict) -> dict:
+    out = {}
+    for team_group in (summary.get("boxscore") or {}).get("players") or []:
+        team_id = (team_group.get("team") or {}).get("id")
+        for stat_group in team_group.get("statistics") or []:
+            if str(stat_group.get("type") or "").lower() != "pitching":
+                continue
+            for row in stat_group.get("athletes") or []:
+                athlete = row.get("athlete") or {}
+                name = athlete.get("displayName")
+                if row.get("active") and name:
+                    out[str(team_id)] = {"id": athlete.get("id"), "name": name}
+                    break
+    return out
+
+
+def old_extract(summary: dict) -> tuple:
+    return _old_find_probables(summary), _old_player_names(summary), _old_active_pitchers(summary)
+
+
+def new_extract(summary: dict) -> tuple:
+    ex = mlb_espn._extract_summary(summary)
+    return ex["probables"], ex["player_names"], ex["active_pitchers"]
+
+
+def _cpu_us(fn, rounds: int) -> float:
+    fn()  # warm-up
+    start = time.process_time()
+    for _ in range(rounds):
+        fn()
+    return (time.process_time() - start) / rounds * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pre", help="recorded ESPN MLB summary JSON for a pregame")
+    ap.add_argument("--live", help="recorded ESPN MLB summary JSON for a game in progress")
+    ap.add_argument("--final", help="recorded ESPN MLB summary JSON for a final")
+    ap.add_argument("--rounds", type=int, default=500)
+    args = ap.parse_args()
+
+    summaries = {
+        "pre": fixtures.load_json(args.pre, lambda: fixtures.mlb_summary("pre")),
+        "live": fixtures.load_json(args.live, lambda: fixtures.mlb_summary("in")),
+        "final": fixtures.load_json(args.final, lambda: fixtures.mlb_summary("post")),
+    }
+
+    print(f"rounds={args.rounds}")
+    print(f"{'summary':<8} {'old us':>10} {'new us':>10} {'speedup':>8}  same")
+    for name, summary in summaries.items():
+        same = old_extract(summary) == new_extract(summary)
+        t_old = _cpu_us(lambda: old_extract(summary), args.rounds)
+        t_new = _cpu_us(lambda: new_extract(summary), args.rounds)
+        print(f"{name:<8} {t_old:>10.1f} {t_new:>10.1f} {t_old / t_new:>7.1f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
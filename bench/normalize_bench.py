@@ -0,0 +1,86 @@
+# bench/normalize_bench.py
+"""
+Team-name normalization over a full season of matchups.
+
+The season workload is ~5,500 games, each normalizing away/home on both the
+ESPN and KenPom side (plus the flip check), drawn from the distinct team-name
+spellings the two sources use. Measured (CPU time via time.process_time):
+  cold      every call runs the full normalization (memo cleared first)
+  memo      normalize_team with the memo warm
+  many      normalize_many over the same list (dedupes before normalizing)
+
+Usage (from the repo root):
+  python -m bench.normalize_bench [--games 5500] [--rounds 5]
+"""
+import argparse
+import random
+import time
+
+import normalize
+from bench import fixtures
+
+
+def season_names(n_teams: int = 362) -> list[str]:
+    """Distinct spellings: ESPN short/display names, KenPom-style 'St.' forms, and the known aliases."""
+    names = set()
+    for team in fixtures.team_names(n_teams):
+        names.add(team)
+        names.add(f"{team} Mascots")
+        names.add(team.replace("State", "St.").replace("Saint", "St."))
+    for table in (normalize._EXACT, normalize._POST):
+        for alias in table:
+            names.add(alias.title())
+    return sorted(names)
+
+
+def season_calls(distinct: list[str], n_games: int) -> list[str]:
+    rng = random.Random(3)
+    calls = []
+    for _ in range(n_games):
+        away, home = rng.sample(distinct, 2)
+        calls += [away, home, away, home, home, away]  # matchup_key, teamset key, flip check
+    return calls
+
+
+def _cpu_ms(fn, rounds: int) -> float:
+    start = time.process_time()
+    for _ in range(rounds):
+        fn()
+    return (time.process_time() - start) / rounds * 1e3
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--games", type=int, default=5500)
+    ap.add_argument("--rounds", type=int, default=5)
+    args = ap.parse_args()
+
+    distinct = season_names()
+    calls = season_calls(distinct, args.games)
+
+    def cold():
+        normalize._normalize.cache_clear()
+        for name in calls:
+            normalize._normalize.__wrapped__(name)
+
+    def memo():
+        for name in calls:
+            normalize.normalize_team(name)
+
+    def many():
+        normalize.normalize_many(calls)
+
+    memo()  # warm
+    t_cold = _cpu_ms(cold, args.rounds)
+    memo()
+    t_memo = _cpu_ms(memo, args.rounds)
+    t_many = _cpu_ms(many, args.rounds)
+
+    print(f"distinct_names={len(distinct)} calls={len(calls)} rounds={args.rounds}")
+    print(f"{'mode':<6} {'ms/season':>10} {'us/call':>9} {'speedup':>8}")
+    for name, t in (("cold", t_cold), ("memo", t_memo), ("many", t_many)):
+        print(f"{name:<6} {t:>10.1f} {t * 1e3 / len(calls):>9.2f} {t_cold / t:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
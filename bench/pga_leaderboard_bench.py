@@ -0,0 +1,57 @@
+# bench/pga_leaderboard_bench.py
+"""
+PGA leaderboard refresh: full re-normalization vs the incremental path.
+
+Each poll during a round, a handful of golfers finish a hole. Measured per
+refresh of a 156-player field (CPU time via time.process_time):
+  full         _normalize_leaderboard_rows over every competitor (previous behavior)
+  incremental  _incremental_leaderboard_rows, re-normalizing only changed golfers
+
+Usage (from the repo root):
+  python -m bench.pga_leaderboard_bench [--field 156] [--moved 12] [--rounds 200]
+"""
+import argparse
+import random
+import time
+
+from bench import fixtures
+from services import pga_espn
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--field", type=int, default=156)
+    ap.add_argument("--moved", type=int, default=12)
+    ap.add_argument("--rounds", type=int, default=200)
+    args = ap.parse_args()
+
+    competitors = fixtures.pga_competitors(args.field)
+    tee = "2026-07-18T11:00Z"
+    pga_espn._incremental_leaderboard_rows("bench", competitors, tee)  # prior snapshot
+
+    rng = random.Random(11)
+    t_full = t_inc = 0.0
+    renormalized = 0
+    for _ in range(args.rounds):
+        fixtures.pga_tick(competitors, args.moved, rng)
+
+        start = time.process_time()
+        pga_espn._normalize_leaderboard_rows(competitors, tee)
+        t_full += time.process_time() - start
+
+        start = time.process_time()
+        _, n = pga_espn._incremental_leaderboard_rows("bench", competitors, tee)
+        t_inc += time.process_time() - start
+        renormalized += n
+
+    t_full = t_full / args.rounds * 1e3
+    t_inc = t_inc / args.rounds * 1e3
+    print(f"field={args.field} moved/poll={args.moved} rounds={args.rounds} "
+          f"renormalized/poll={renormalized / args.rounds:.1f}")
+    print(f"{'mode':<12} {'ms/refresh':>11} {'speedup':>8}")
+    print(f"{'full':<12} {t_full:>11.3f} {1:>7.1f}x")
+    print(f"{'incremental':<12} {t_inc:>11.3f} {t_full / t_inc:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
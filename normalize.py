@@ -2,12 +2,127 @@
 # ---------- Team normalization ----------
 import re
 import unicodedata
+from functools import lru_cache
+from typing import Iterable
+
+NORMALIZE_CACHE_SIZE = 8192  # distinct raw names; a CBB season has ~1-2k spellings
+
+_RE_PUNCT = re.compile(r"[.'’]")
+_RE_SPACES = re.compile(r"\s+")
+_RE_TRAILING_ST = re.compile(r"\bst$")
+_RE_TRAILING_U = re.compile(r"\bu\b$")
+
+# --- exact mappings (highest priority; pre-normalization aliases) ---
+_EXACT: dict[str, str] = {
+    "uconn": "connecticut",
+    "fau": "florida atlantic",
+    "fiu": "florida international",
+    "etsu": "east tennessee state",
+
+    "jax state": "jacksonville state",
+    "purdue fw": "purdue fort wayne",
+    "charleston so": "charleston southern",
+    "s illinois": "southern illinois",
+
+    # directional short forms
+    "w michigan": "western michigan",
+    "e michigan": "eastern michigan",
+    "c michigan": "central michigan",
+    "g washington": "george washington",
+    "n illinois": "northern illinois",
+
+    # explicit State schools
+    "san jose st": "san jose state",
+    "youngstown st": "youngstown state",
+
+    # nicknames / common names
+    "ole miss": "mississippi",
+
+    # St Thomas variants
+    "st thomas (mn)": "st thomas",
+    "st thomas mn": "st thomas",
+
+    # ESPN quirks
+    "uic": "illinois chicago",
+    "boston u": "boston university",
+    "miami": "miami fl",
+    # 1/5 alias fixes (ESPN / KenPom name differences)
+    "ar pine bluff": "arkansas pine bluff",
+    "prairie view": "prairie view aandm",
+    "prairie view aandm": "prairie view aandm",
+    "se louisiana": "southeastern louisiana",
+    "ut rio grande": "ut rio grande valley",
+    "sf austin": "stephen f austin",
+    "miss valley st": "mississippi valley state",
+    "hou christian": "houston christian",
+    "texas aandm cc": "texas aandm corpus christi",
+    "texas aandm corpus chris": "texas aandm corpus christi",
+    # 1/5 remaining mismatches
+    "grambling": "grambling state",
+    "nwestern state": "northwestern state",
+    "eastern texas aandm": "east texas aandm",
+    "pitt": "pittsburgh",
+    "ualbany": "albany",
+    "ga southern": "georgia southern",
+    "sc state": "south carolina state",
+    "nc central": "north carolina central",
+    "md eastern": "maryland eastern shore",
+    "sc upstate": "usc upstate",
+}
+
+# expand common abbreviations at the START of the name (first match wins)
+_START_REPLACEMENTS: dict[str, str] = {
+    "w ": "western ",
+    "e ": "eastern ",
+    "c ": "central ",
+    "g ": "george ",
+    "n ": "northern ",
+    "umass": "massachusetts",
+}
+
+# --- post-normalization aliases (runs AFTER punctuation/prefix rules) ---
+_POST: dict[str, str] = {
+    "fdu": "fairleigh dickinson",
+    "fgcu": "florida gulf coast",
+    "app state": "appalachian state",
+    "coastal": "coastal carolina",
+    "nc aandt": "north carolina aandt",
+    "long island": "liu",
+    "ut martin": "tennessee martin",
+    "sam houston": "sam houston state",
+    "s dakota state": "south dakota state",
+    "northern dakota state": "north dakota state",
+    "omaha": "nebraska omaha",
+    "ul monroe": "louisiana monroe",
+    "mtsu": "middle tennessee",
+
+    "santa barbara": "uc santa barbara",
+    "abilene chrstn": "abilene christian",
+    "se missouri": "southeast missouri",          # <-- FIXED (one-hop)
+    "so indiana": "southern indiana",
+    "bakersfield": "cal st bakersfield",
+    "csu northridge": "csun",
+    "ca baptist": "cal baptist",
+    "fullerton": "cal st fullerton",
+    "southeast missouri state": "southeast missouri",
+    "western ky": "western kentucky",
+    "seattle university": "seattle",
+    "lmu": "loyola marymount",
+    # 1/5 remaining mismatches (ESPN abbreviations after rules run)
+    "nwestern state": "northwestern state",
+    "eastern texas aandm": "east texas aandm",
+    "bethune": "bethune cookman",
+}
 
 
 def normalize_team(name: str | None) -> str:
     if not name:
         return ""
+    return _normalize(name)
 
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(name: str) -> str:
     s = name.strip().lower()
 
     # remove accents (san josé -> san jose)
@@ -17,81 +132,15 @@ def normalize_team(name: str | None) -> str:
     # normalize punctuation/symbols
     s = s.replace("&", "and")
     s = s.replace("-", " ")          # Gardner-Webb -> Gardner Webb
-    s = re.sub(r"[.'’]", "", s)      # remove dots/apostrophes
+    s = _RE_PUNCT.sub("", s)         # remove dots/apostrophes
 
     # collapse whitespace early
-    s = re.sub(r"\s+", " ", s).strip()
-
-    # --- exact mappings (highest priority; pre-normalization aliases) ---
-    exact = {
-        "uconn": "connecticut",
-        "fau": "florida atlantic",
-        "fiu": "florida international",
-        "etsu": "east tennessee state",
-
-        "jax state": "jacksonville state",
-        "purdue fw": "purdue fort wayne",
-        "charleston so": "charleston southern",
-        "s illinois": "southern illinois",
-
-        # directional short forms
-        "w michigan": "western michigan",
-        "e michigan": "eastern michigan",
-        "c michigan": "central michigan",
-        "g washington": "george washington",
-        "n illinois": "northern illinois",
-
-        # explicit State schools
-        "san jose st": "san jose state",
-        "youngstown st": "youngstown state",
-
-        # nicknames / common names
-        "ole miss": "mississippi",
-
-        # St Thomas variants
-        "st thomas (mn)": "st thomas",
-        "st thomas mn": "st thomas",
-
-        # ESPN quirks
-        "uic": "illinois chicago",
-        "boston u": "boston university",
-        "miami": "miami fl",
-        # 1/5 alias fixes (ESPN / KenPom name differences)
-        "ar pine bluff": "arkansas pine bluff",
-        "prairie view": "prairie view aandm",
-        "prairie view aandm": "prairie view aandm",
-        "se louisiana": "southeastern louisiana",
-        "ut rio grande": "ut rio grande valley",
-        "sf austin": "stephen f austin",
-        "miss valley st": "mississippi valley state",
-        "hou christian": "houston christian",
-        "texas aandm cc": "texas aandm corpus christi",
-        "texas aandm corpus chris": "texas aandm corpus christi",
-        # 1/5 remaining mismatches
-        "grambling": "grambling state",
-        "nwestern state": "northwestern state",
-        "eastern texas aandm": "east texas aandm",
-        "pitt": "pittsburgh",
-        "ualbany": "albany",
-        "ga southern": "georgia southern",
-        "sc state": "south carolina state",
-        "nc central": "north carolina central",
-        "md eastern": "maryland eastern shore",
-        "sc upstate": "usc upstate",
-    }
-    if s in exact:
-        return exact[s]
-
-    # expand common abbreviations at the START of the name
-    start_replacements = {
-        "w ": "western ",
-        "e ": "eastern ",
-        "c ": "central ",
-        "g ": "george ",
-        "n ": "northern ",
-        "umass": "massachusetts",
-    }
-    for prefix, full in start_replacements.items():
+    s = _RE_SPACES.sub(" ", s).strip()
+
+    if s in _EXACT:
+        return _EXACT[s]
+
+    for prefix, full in _START_REPLACEMENTS.items():
         if s.startswith(prefix):
             s = full + s[len(prefix):]
             break
@@ -99,48 +148,22 @@ def normalize_team(name: str | None) -> str:
     # convert trailing "... st" -> "... state"
     # safe: does NOT affect "st johns", "st marys", etc.
     if s.endswith(" st"):
-        s = re.sub(r"\bst$", "state", s)
+        s = _RE_TRAILING_ST.sub("state", s)
 
     # convert trailing "... u" -> "... university"
-    s = re.sub(r"\bu\b$", "university", s)
+    s = _RE_TRAILING_U.sub("university", s)
 
     # final whitespace cleanup
-    s = re.sub(r"\s+", " ", s).strip()
-
-    # --- post-normalization aliases (runs AFTER punctuation/prefix rules) ---
-    post = {
-        "fdu": "fairleigh dickinson",
-        "fgcu": "florida gulf coast",
-        "app state": "appalachian state",
-        "coastal": "coastal carolina",
-        "nc aandt": "north carolina aandt",
-        "long island": "liu",
-        "ut martin": "tennessee martin",
-        "sam houston": "sam houston state",
-        "s dakota state": "south dakota state",
-        "northern dakota state": "north dakota state",
-        "omaha": "nebraska omaha",
-        "ul monroe": "louisiana monroe",
-        "mtsu": "middle tennessee",
-
-        "santa barbara": "uc santa barbara",
-        "abilene chrstn": "abilene christian",
-        "se missouri": "southeast missouri",          # <-- FIXED (one-hop)
-        "so indiana": "southern indiana",
-        "bakersfield": "cal st bakersfield",
-        "csu northridge": "csun",
-        "ca baptist": "cal baptist",
-        "fullerton": "cal st fullerton",
-        "southeast missouri state": "southeast missouri",
-        "western ky": "western kentucky",
-        "seattle university": "seattle",
-        "lmu": "loyola marymount",
-        # 1/5 remaining mismatches (ESPN abbreviations after rules run)
-        "nwestern state": "northwestern state",
-        "eastern texas aandm": "east texas aandm",
-        "bethune": "bethune cookman",
-    }
-    return post.get(s, s)
+    s = _RE_SPACES.sub(" ", s).strip()
+
+    return _POST.get(s, s)
+
+
+def normalize_many(names: Iterable[str | None]) -> list[str]:
+    """normalize_team over a batch; each distinct name is normalized once. Output aligns with input."""
+    names = list(names)
+    done = {n: normalize_team(n) for n in dict.fromkeys(names)}
+    return [done[n] for n in names]
 
 
 def matchup_key(away: str | None, home: str | None) -> str:
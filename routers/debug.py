@@ -3,6 +3,7 @@ import os
 from fastapi import APIRouter, HTTPException
 from services.espn import fetch_scoreboard, parse_games
 from services.kenpom import fetch_fanmatch
+from services import cache_janitor, cache_sqlite, refresher, upstream
 
 router = APIRouter()
 
@@ -33,3 +34,18 @@ def debug_kenpom(date: str):
     require_debug()
     data = fetch_fanmatch(date)
     return {"count": len(data), "games": data[:25]}
+
+@router.get("/debug/refresher")
+def debug_refresher():
+    require_debug()
+    return refresher.status()
+
+@router.get("/debug/upstream")
+def debug_upstream():
+    require_debug()
+    return upstream.stats()
+
+@router.get("/debug/cache")
+def debug_cache():
+    require_debug()
+    return {**cache_sqlite.cache_stats(), "janitor": cache_janitor.status()}
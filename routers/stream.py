@@ -0,0 +1,118 @@
+# routers/stream.py
+"""
+Server-Sent Events push for live slates.
+
+Each connection gets one "snapshot" event with the full payload, then a "game"
+event (the full game object) whenever anything in a game changes (score, clock,
+MLB live situation, or KenPom fields arriving after an ESPN-only build), and a
+"remove" event when a game drops off the slate. The stream reads the same
+in-memory snapshot as /games (or the shared on-demand build for dates the
+refresher does not hold), so an idle viewer costs an identity check every few
+seconds instead of a full download.
+"""
+import asyncio
+import time
+from typing import Any, Callable
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from utils import codec
+from utils.dates import today_yyyymmdd_eastern
+from services import refresher, slate_versions
+
+router = APIRouter()
+
+STREAM_POLL_SECONDS = 2
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {codec.dumps_str(data)}\n\n"
+
+
+async def _stream(
+    request: Request,
+    load: Callable[[], Any],
+    games_of: Callable[[Any], list],
+    slate: tuple[str, str],
+    id_field: str,
+):
+    prev: dict[str, str] | None = None
+    prev_games = None
+    last_sent = time.monotonic()
+
+    while not await request.is_disconnected():
+        try:
+            payload = await run_in_threadpool(load)
+        except Exception as e:
+            yield _sse("error", {"error": f"{type(e).__name__}: {e}"})
+            last_sent = time.monotonic()
+            await asyncio.sleep(STREAM_POLL_SECONDS)
+            continue
+
+        games = games_of(payload) or []
+        # The same snapshot object as last time cannot have changed; skip the diff.
+        if games is not prev_games:
+            prev_games = games
+            # per-game fingerprints are shared with /games versioning (one hash per snapshot)
+            cur = slate_versions.fingerprints(*slate, games, id_field)
+
+            if prev is None:
+                yield _sse("snapshot", payload)
+                last_sent = time.monotonic()
+            else:
+                for g in games:
+                    gid = str(g.get(id_field) or "")
+                    if prev.get(gid) != cur.get(gid):
+                        yield _sse("game", g)
+                        last_sent = time.monotonic()
+                for gid in prev.keys() - cur.keys():
+                    yield _sse("remove", {"id": gid})
+                    last_sent = time.monotonic()
+            prev = cur
+
+        if time.monotonic() - last_sent >= STREAM_KEEPALIVE_SECONDS:
+            yield ": keepalive\n\n"
+            last_sent = time.monotonic()
+
+        await asyncio.sleep(STREAM_POLL_SECONDS)
+
+
+def _event_stream(gen) -> StreamingResponse:
+    return StreamingResponse(
+        gen,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/games/stream")
+async def games_stream(
+    request: Request,
+    date_espn: str | None = Query(default=None),
+    date_kp: str | None = Query(default=None),
+    sport: str | None = Query(default="cbb"),
+):
+    date_espn = date_espn or today_yyyymmdd_eastern()
+    date_kp = date_kp or date_espn
+    sport = (sport or "cbb").lower()
+    return _event_stream(_stream(
+        request,
+        lambda: refresher.read_games(date_espn, date_kp, sport),
+        lambda payload: payload.get("games"),
+        (sport, date_espn),
+        "event_id",
+    ))
+
+
+@router.get("/mlb/games/stream")
+async def mlb_games_stream(request: Request, date: str):
+    return _event_stream(_stream(
+        request,
+        lambda: {"date": date, "games": refresher.read_mlb_games(date)},
+        lambda payload: payload.get("games"),
+        ("mlb", date),
+        "id",
+    ))
@@ -1,13 +1,40 @@
 # services/build.py
+import hashlib
 import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from functools import lru_cache
 from pathlib import Path
 
 from fastapi import HTTPException
 from normalize import matchup_key, normalize_team
 from utils.dates import kp_date, is_future_yyyymmdd_eastern
-from services.espn import fetch_scoreboard, parse_games
-from services.kenpom import fetch_fanmatch
+from services.espn import get_scoreboard
+from services.kenpom import fetch_fanmatch_with_meta
+from services import fuzzy_match, slate_versions, team_registry
+from utils import codec
+
+# Built slates keyed by (sport, date_espn, date_kp, policy, ESPN body hash, KenPom rows hash):
+# a poll whose upstream inputs did not change gets the previous result back without re-merging.
+BUILD_MEMO_MAX_ENTRIES = 32
+_build_memo: dict[tuple, dict] = {}
+_build_memo_lock = threading.Lock()
+
+# ESPN and KenPom are fetched concurrently under one deadline per merge, so a cold build
+# costs max(ESPN, KenPom) instead of the sum. A KenPom miss degrades to ESPN-only output.
+MERGE_DEADLINE_SECONDS = float(os.getenv("MERGE_DEADLINE_SECONDS", "20"))
+MERGE_FETCH_WORKERS = int(os.getenv("MERGE_FETCH_WORKERS", "8"))
+_fetch_pool = ThreadPoolExecutor(max_workers=MERGE_FETCH_WORKERS, thread_name_prefix="merge-fetch")
+
+KP_TIMEOUT_WARNING = "KenPom did not respond in time; showing ESPN data only."
+
+# id(kp rows list) -> (rows, hash). The cache L1 hands back the same list object until the
+# row is refreshed, so hashing happens once per KenPom payload rather than once per request.
+_KP_HASH_MEMO_MAX = 16
+_kp_hash_memo: dict[int, tuple[list, str]] = {}
+_kp_hash_lock = threading.Lock()
 
 
 def _kp_by_key(kp_rows: list[dict]) -> dict[str, dict]:
@@ -32,17 +59,65 @@ def _kp_by_teamset(kp_rows: list[dict]) -> dict[tuple[str, str], list[dict]]:
     return out
 
 
-def _find_kp_match_for_espn_game(e: dict, kp_by_key: dict[str, dict], kp_by_teamset: dict[tuple[str, str], list[dict]]) -> tuple[dict | None, bool]:
+def _kp_by_team(kp_rows: list[dict]) -> dict[str, list[dict]]:
+    """Raw KenPom team name -> rows that team appears in (either side)."""
+    out: dict[str, list[dict]] = {}
+    for g in kp_rows:
+        for side in ("Visitor", "Home"):
+            name = g.get(side)
+            if name:
+                out.setdefault(name, []).append(g)
+    return out
+
+
+def _find_kp_match_by_team_id(e: dict, kp_by_team: dict[str, list[dict]]) -> tuple[dict | None, bool]:
+    """
+    Match through services/team_registry: one known team id is enough, as long as that
+    KenPom team plays exactly once on the date. If the other team is known too, it must
+    not be playing in a different row (it may be absent, e.g. renamed on KenPom's side).
+    """
+    away_kp = team_registry.kp_name(e.get("away_team_id"))
+    home_kp = team_registry.kp_name(e.get("home_team_id"))
+    for name, other, espn_side in ((away_kp, home_kp, "Visitor"), (home_kp, away_kp, "Home")):
+        if not name:
+            continue
+        rows = kp_by_team.get(name) or []
+        if len(rows) != 1:
+            continue
+        kp = rows[0]
+        if other and other in kp_by_team and other not in (kp.get("Visitor"), kp.get("Home")):
+            return None, False
+        return kp, kp.get(espn_side) != name
+    return None, False
+
+
+def _learned_team_ids(e: dict, kp: dict, flipped: bool) -> dict[str, str]:
+    away_kp, home_kp = (kp.get("Home"), kp.get("Visitor")) if flipped else (kp.get("Visitor"), kp.get("Home"))
+    return {e.get("away_team_id") or "": away_kp, e.get("home_team_id") or "": home_kp}
+
+
+def _find_kp_match_for_espn_game(
+    e: dict,
+    kp_by_key: dict[str, dict],
+    kp_by_teamset: dict[tuple[str, str], list[dict]],
+    kp_by_team: dict[str, list[dict]],
+) -> tuple[dict | None, bool, str | None]:
+    """(kp row or None, flipped, match method: "team_id" | "key" | "teamset" | None)"""
+    # Known ESPN team ids: O(1) lookup, no name normalization involved
+    kp, flipped = _find_kp_match_by_team_id(e, kp_by_team)
+    if kp:
+        return kp, flipped, "team_id"
+
     # Primary exact key match (away @ home orientation aligned)
     kp = kp_by_key.get(e.get("key"))
     if kp:
-        return kp, False
+        return kp, False, "key"
 
     # Fallback for occasional ESPN/KenPom home-away inversion on neutral-site style listings.
     pair_key = _teamset_key(e.get("away"), e.get("home"))
     candidates = kp_by_teamset.get(pair_key) or []
     if len(candidates) != 1:
-        return None, False
+        return None, False, None
 
     candidate = candidates[0]
     espn_away = normalize_team(e.get("away"))
@@ -51,7 +126,48 @@ def _find_kp_match_for_espn_game(e: dict, kp_by_key: dict[str, dict], kp_by_team
     kp_home = normalize_team(candidate.get("Home"))
 
     flipped = (espn_away == kp_home and espn_home == kp_away)
-    return candidate, flipped
+    return candidate, flipped, "teamset"
+
+
+def _kp_rows_hash(kp_rows: list[dict]) -> str:
+    with _kp_hash_lock:
+        hit = _kp_hash_memo.get(id(kp_rows))
+    if hit is not None and hit[0] is kp_rows:
+        return hit[1]
+    digest = hashlib.blake2b(codec.dumps(kp_rows), digest_size=16).hexdigest()
+    with _kp_hash_lock:
+        if len(_kp_hash_memo) >= _KP_HASH_MEMO_MAX:
+            _kp_hash_memo.pop(next(iter(_kp_hash_memo)))
+        # keep a reference to the list so its id() cannot be reused while memoized
+        _kp_hash_memo[id(kp_rows)] = (kp_rows, digest)
+    return digest
+
+
+def _memo_get(key: tuple) -> dict | None:
+    with _build_memo_lock:
+        return _build_memo.get(key)
+
+
+def _memo_put(key: tuple, value: dict):
+    with _build_memo_lock:
+        _build_memo.pop(key, None)
+        if len(_build_memo) >= BUILD_MEMO_MAX_ENTRIES:
+            _build_memo.pop(next(iter(_build_memo)))
+        _build_memo[key] = value
+
+
+def _kp_rows(date_kp: str) -> tuple[list[dict], dict | None]:
+    """
+    KenPom fanmatch rows plus a staleness marker (None when fresh).
+    The marker goes into the response as "kp_stale" so the UI can tell cached predictions apart.
+    """
+    rows, meta = fetch_fanmatch_with_meta(date_kp)
+    if meta.get("source") not in ("stale", "stale-error"):
+        return rows, None
+    return rows, {
+        "reason": "origin_error" if meta["source"] == "stale-error" else "revalidating",
+        "age_seconds": max(0, int(time.time()) - int(meta.get("fetched_at") or 0)),
+    }
 
 
 # ----------------------------
@@ -122,7 +238,16 @@ def _attach_conf_fields(out_game: dict, e: dict) -> dict:
 # Builders
 # ----------------------------
 def espn_only_games(date_espn: str, sport: str = "cbb") -> dict:
-    espn_games = parse_games(fetch_scoreboard(date_espn, sport))
+    scoreboard = get_scoreboard(date_espn, sport)
+    memo_key = (sport, date_espn, None, "espn_only", scoreboard["hash"], None)
+    built = _memo_get(memo_key)
+    if built is None:
+        built = _espn_only_games(date_espn, scoreboard["games"])
+        _memo_put(memo_key, built)
+    return dict(built)
+
+
+def _espn_only_games(date_espn: str, espn_games: list[dict]) -> dict:
     games = []
     for e in espn_games:
         g = {
@@ -168,109 +293,198 @@ def espn_only_games(date_espn: str, sport: str = "cbb") -> dict:
     }
 
 
-def merge_strict(date_espn: str, date_kp: str, sport: str = "cbb") -> dict:
-    espn_games = parse_games(fetch_scoreboard(date_espn, sport))
-    kp_rows = fetch_fanmatch(date_kp)
+MISSING_ERROR = "Merge missing KenPom for some ESPN games"
+MISSING_WARNING = "Some ESPN games did not match KenPom FanMatch for this date."
+
+# Output policies for merge_games()
+STRICT = "strict"        # raise (HTTP 500) if any ESPN game has no KenPom row
+LENIENT = "lenient"      # keep unmatched games with empty KP fields
+FALLBACK = "fallback"    # strict output when everything matched, else lenient + missing_* + warning
+
+
+def _merged_game(e: dict, kp: dict | None, flipped: bool) -> dict:
+    g = {
+        "key": e["key"],
+        "event_id": e["event_id"],
+        "away": e["away"],
+        "home": e["home"],
+        "away_logo": e.get("away_logo"),
+        "home_logo": e.get("home_logo"),
+        "start_utc": e["start_utc"],
+        "network": e["network"],
+
+        "status_state": e.get("status_state"),
+        "status_detail": e.get("status_detail"),
+        "clock": e.get("clock"),
+        "period": e.get("period"),
+        "away_score": e.get("away_score"),
+        "home_score": e.get("home_score"),
+
+        "kp_found": kp is not None,
+        "kp_game_id": kp.get("GameID") if kp else None,
+        "kp_home_pred": (kp.get("VisitorPred") if flipped else kp.get("HomePred")) if kp else None,
+        "kp_away_pred": (kp.get("HomePred") if flipped else kp.get("VisitorPred")) if kp else None,
+        "kp_home_wp": ((100 - kp.get("HomeWP")) if (flipped and kp.get("HomeWP") is not None) else kp.get("HomeWP")) if kp else None,
+        "kp_thrill": kp.get("ThrillScore") if kp else None,
+        "kp_pred_tempo": kp.get("PredTempo") if kp else None,
+        "kp_home_rank": (kp.get("VisitorRank") if flipped else kp.get("HomeRank")) if kp else None,
+        "kp_away_rank": (kp.get("HomeRank") if flipped else kp.get("VisitorRank")) if kp else None,
+    }
+    return _attach_conf_fields(g, e)
+
+
+def merge_engine(espn_games: list[dict], kp_rows: list[dict]) -> tuple[list[dict], list[dict], dict]:
+    """
+    One pass over the slate: every ESPN game in order (unmatched ones with empty KP
+    fields), the unmatched ESPN games, and match diagnostics
+    {"matched", "missing", "flipped", "by_method": {method: count}, "fuzzy": [...]}.
+
+    Games the exact/team-id matching leaves over get one more try against the
+    unclaimed KenPom rows via services/fuzzy_match.py; those matches are listed in
+    "fuzzy" with their score (and not learned into the team registry) so they can be
+    reviewed and promoted into the alias tables.
+    """
     kp_by_key = _kp_by_key(kp_rows)
     kp_by_teamset = _kp_by_teamset(kp_rows)
+    kp_by_team = _kp_by_team(kp_rows)
+
+    matches = []
+    leftover = []
+    for i, e in enumerate(espn_games):
+        kp, flipped, method = _find_kp_match_for_espn_game(e, kp_by_key, kp_by_teamset, kp_by_team)
+        matches.append((kp, flipped, method))
+        if kp is None:
+            leftover.append(i)
+
+    fuzzy = []
+    if leftover:
+        claimed = {id(kp) for kp, _, _ in matches if kp is not None}
+        index = fuzzy_match.build_index([g for g in kp_rows if id(g) not in claimed])
+        # Score every leftover x candidate pair, then assign best-first so a weak early
+        # game can't take a row that a later game matches better.
+        pairs = []
+        for i in leftover:
+            e = espn_games[i]
+            for kp, flipped, score in fuzzy_match.candidates(index, e.get("away"), e.get("home")):
+                pairs.append((score, i, kp, flipped))
+        pairs.sort(key=lambda p: (-p[0], p[1]))
+        fuzzy_by_game: dict[int, dict] = {}
+        for score, i, kp, flipped in pairs:
+            if i in fuzzy_by_game or id(kp) in claimed:
+                continue
+            e = espn_games[i]
+            claimed.add(id(kp))
+            matches[i] = (kp, flipped, "fuzzy")
+            fuzzy_by_game[i] = {
+                "event_id": e.get("event_id"),
+                "away": e.get("away"),
+                "home": e.get("home"),
+                "kp_visitor": kp.get("Visitor"),
+                "kp_home": kp.get("Home"),
+                "flipped": flipped,
+                "score": round(score, 3),
+            }
+        fuzzy = [fuzzy_by_game[i] for i in sorted(fuzzy_by_game)]
 
-    merged = []
+    games = []
     missing = []
-    for e in espn_games:
-        kp, flipped = _find_kp_match_for_espn_game(e, kp_by_key, kp_by_teamset)
-        if not kp:
+    learned: dict[str, str] = {}
+    by_method: dict[str, int] = {}
+    flipped_count = 0
+    for e, (kp, flipped, method) in zip(espn_games, matches):
+        if kp:
+            if method != "fuzzy":
+                learned.update(_learned_team_ids(e, kp, flipped))
+            by_method[method] = by_method.get(method, 0) + 1
+            flipped_count += flipped
+        else:
             missing.append(e)
-            continue
-
-        g = {
-            "key": e["key"],
-            "event_id": e["event_id"],
-            "away": e["away"],
-            "home": e["home"],
-            "away_logo": e.get("away_logo"),
-            "home_logo": e.get("home_logo"),
-            "start_utc": e["start_utc"],
-            "network": e["network"],
-
-            "status_state": e.get("status_state"),
-            "status_detail": e.get("status_detail"),
-            "clock": e.get("clock"),
-            "period": e.get("period"),
-            "away_score": e.get("away_score"),
-            "home_score": e.get("home_score"),
-
-            "kp_found": True,
-            "kp_game_id": kp.get("GameID"),
-            "kp_home_pred": kp.get("VisitorPred") if flipped else kp.get("HomePred"),
-            "kp_away_pred": kp.get("HomePred") if flipped else kp.get("VisitorPred"),
-            "kp_home_wp": (100 - kp.get("HomeWP")) if (flipped and kp.get("HomeWP") is not None) else kp.get("HomeWP"),
-            "kp_thrill": kp.get("ThrillScore"),
-            "kp_pred_tempo": kp.get("PredTempo"),
-            "kp_home_rank": kp.get("VisitorRank") if flipped else kp.get("HomeRank"),
-            "kp_away_rank": kp.get("HomeRank") if flipped else kp.get("VisitorRank"),
-        }
+        games.append(_merged_game(e, kp, flipped))
 
-        _attach_conf_fields(g, e)
-        merged.append(g)
+    team_registry.learn(learned)
 
-    if missing:
-        raise HTTPException(
-            status_code=500,
-            detail={
-                "error": "Merge missing KenPom for some ESPN games",
-                "missing_count": len(missing),
-                "missing_sample": missing[:10],
-            },
-        )
+    diagnostics = {
+        "matched": len(games) - len(missing),
+        "missing": len(missing),
+        "flipped": flipped_count,
+        "by_method": by_method,
+        "fuzzy": fuzzy,
+    }
+    return games, missing, diagnostics
 
-    return {"date_espn": date_espn, "date_kp": kp_date(date_kp), "count": len(merged), "games": merged}
 
+def merge_games(date_espn: str, date_kp: str, sport: str = "cbb", policy: str = FALLBACK) -> dict:
+    """
+    Merged slate under `policy`. Results are memoized per upstream content; the returned
+    dict is a fresh shallow copy, but "games" and the nested objects are shared: don't mutate them.
+    """
+    deadline = time.monotonic() + MERGE_DEADLINE_SECONDS
+    kp_future = _fetch_pool.submit(_kp_rows, date_kp)
+    espn_future = _fetch_pool.submit(get_scoreboard, date_espn, sport)
 
-def merge_lenient(date_espn: str, date_kp: str, sport: str = "cbb") -> dict:
-    espn_games = parse_games(fetch_scoreboard(date_espn, sport))
-    kp_rows = fetch_fanmatch(date_kp)
-    kp_by_key = _kp_by_key(kp_rows)
-    kp_by_teamset = _kp_by_teamset(kp_rows)
+    # Errors from either fetch propagate unchanged; only running out of time is special-cased.
+    try:
+        scoreboard = espn_future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeout:
+        raise HTTPException(status_code=500, detail=f"ESPN request timed out after {MERGE_DEADLINE_SECONDS:g}s")
+    try:
+        kp_rows, kp_stale = kp_future.result(timeout=max(0.0, deadline - time.monotonic()))
+    except FutureTimeout:
+        # The KenPom fetch keeps running and fills the cache for the next poll.
+        if policy == STRICT:
+            raise HTTPException(status_code=500, detail=f"KenPom request timed out after {MERGE_DEADLINE_SECONDS:g}s")
+        out = espn_only_games(date_espn, sport)
+        out.update({"date_kp": kp_date(date_kp), "mode": "espn_only", "warning": KP_TIMEOUT_WARNING})
+        return out
+
+    memo_key = (sport, date_espn, date_kp, policy, scoreboard["hash"], _kp_rows_hash(kp_rows))
+
+    built = _memo_get(memo_key)
+    if built is None:
+        games, missing, diagnostics = merge_engine(scoreboard["games"], kp_rows)
+
+        if missing and policy == STRICT:
+            raise HTTPException(
+                status_code=500,
+                detail={
+                    "error": MISSING_ERROR,
+                    "missing_count": len(missing),
+                    "missing_sample": missing[:10],
+                },
+            )
+
+        extra = {"match": diagnostics}
+        if missing and policy == FALLBACK:
+            extra["missing_count"] = len(missing)
+            extra["missing_sample"] = missing[:10]
+            extra["warning"] = MISSING_WARNING
+        built = {"games": games, "extra": extra}
+        _memo_put(memo_key, built)
+
+    out = {"date_espn": date_espn, "date_kp": kp_date(date_kp), "count": len(built["games"]), "games": built["games"]}
+    # kp_stale carries an age, so it is added per call rather than memoized
+    if kp_stale:
+        out["kp_stale"] = kp_stale
+    out.update(built["extra"])
+    return out
 
-    merged = []
-    for e in espn_games:
-        kp, flipped = _find_kp_match_for_espn_game(e, kp_by_key, kp_by_teamset)
 
-        g = {
-            "key": e["key"],
-            "event_id": e["event_id"],
-            "away": e["away"],
-            "home": e["home"],
-            "away_logo": e.get("away_logo"),
-            "home_logo": e.get("home_logo"),
-            "start_utc": e["start_utc"],
-            "network": e["network"],
+def merge_strict(date_espn: str, date_kp: str, sport: str = "cbb") -> dict:
+    return merge_games(date_espn, date_kp, sport, STRICT)
 
-            "status_state": e.get("status_state"),
-            "status_detail": e.get("status_detail"),
-            "clock": e.get("clock"),
-            "period": e.get("period"),
-            "away_score": e.get("away_score"),
-            "home_score": e.get("home_score"),
 
-            "kp_found": kp is not None,
-            "kp_game_id": kp.get("GameID") if kp else None,
-            "kp_home_pred": (kp.get("VisitorPred") if flipped else kp.get("HomePred")) if kp else None,
-            "kp_away_pred": (kp.get("HomePred") if flipped else kp.get("VisitorPred")) if kp else None,
-            "kp_home_wp": ((100 - kp.get("HomeWP")) if (flipped and kp.get("HomeWP") is not None) else kp.get("HomeWP")) if kp else None,
-            "kp_thrill": kp.get("ThrillScore") if kp else None,
-            "kp_pred_tempo": kp.get("PredTempo") if kp else None,
-            "kp_home_rank": (kp.get("VisitorRank") if flipped else kp.get("HomeRank")) if kp else None,
-            "kp_away_rank": (kp.get("HomeRank") if flipped else kp.get("VisitorRank")) if kp else None,
-        }
+def merge_lenient(date_espn: str, date_kp: str, sport: str = "cbb") -> dict:
+    return merge_games(date_espn, date_kp, sport, LENIENT)
 
-        _attach_conf_fields(g, e)
-        merged.append(g)
 
-    return {"date_espn": date_espn, "date_kp": kp_date(date_kp), "count": len(merged), "games": merged}
+def build_games_for_date(date_espn: str, date_kp: str, sport: str = "cbb") -> dict:
+    out = _build_games(date_espn, date_kp, sport)
+    # Version only moves when some game's content changed (see services/slate_versions.py)
+    out["version"] = slate_versions.stamp(sport, date_espn, out.get("games") or [], "event_id")
+    return out
 
 
-def build_games_for_date(date_espn: str, date_kp: str, sport: str = "cbb") -> dict:
+def _build_games(date_espn: str, date_kp: str, sport: str = "cbb") -> dict:
     # For CFB and NFL we only use ESPN scoreboard data (no KenPom merge exists)
     if sport in ("cfb", "nfl"):
         return espn_only_games(date_espn, sport)
@@ -278,30 +492,5 @@ def build_games_for_date(date_espn: str, date_kp: str, sport: str = "cbb") -> di
     if is_future_yyyymmdd_eastern(date_espn):
         return espn_only_games(date_espn, sport)
 
-    # strict then fallback to lenient (same as your current behavior)
-    try:
-        return merge_strict(date_espn, date_kp, sport)
-    except HTTPException as e:
-        detail = e.detail if isinstance(e.detail, dict) else {"error": str(e.detail)}
-        if detail.get("error") != "Merge missing KenPom for some ESPN games":
-            raise
-
-        try:
-            lenient = merge_lenient(date_espn, date_kp, sport)
-        except HTTPException as e2:
-            detail2 = e2.detail if isinstance(e2.detail, dict) else {"error": str(e2.detail)}
-            return {
-                "date_espn": date_espn,
-                "date_kp": kp_date(date_kp),
-                "count": 0,
-                "games": [],
-                "warning": "Lenient merge failed; see error for details.",
-                "error": detail2,
-                "missing_count": detail.get("missing_count", 0),
-                "missing_sample": detail.get("missing_sample", []),
-            }
-
-        lenient["missing_count"] = detail.get("missing_count", 0)
-        lenient["missing_sample"] = detail.get("missing_sample", [])
-        lenient["warning"] = "Some ESPN games did not match KenPom FanMatch for this date."
-        return lenient
+    # Same output as the old strict-then-lenient retry, from a single fetch + match pass
+    return merge_games(date_espn, date_kp, sport, FALLBACK)
@@ -0,0 +1,86 @@
+# services/cache_janitor.py
+"""
+Background upkeep for the SQLite http_cache.
+
+A daemon thread wakes every CACHE_JANITOR_SECONDS and
+  - writes batched last_access updates for L1 hits,
+  - deletes rows that expired more than CACHE_EXPIRED_GRACE_SECONDS ago
+    (the grace keeps recent rows available for stale-on-error),
+  - evicts least-recently accessed rows while the live data exceeds CACHE_MAX_BYTES,
+  - and, when no request has touched the cache for CACHE_IDLE_SECONDS, returns
+    free pages to the OS (incremental vacuum) and truncates the WAL.
+"""
+import os
+import threading
+import time
+from typing import Optional
+
+from services import cache_sqlite
+
+CACHE_JANITOR_SECONDS = int(os.getenv("CACHE_JANITOR_SECONDS", "60"))
+CACHE_EXPIRED_GRACE_SECONDS = int(os.getenv("CACHE_EXPIRED_GRACE_SECONDS", str(3 * 24 * 3600)))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024)))  # 0 = no cap
+CACHE_IDLE_SECONDS = int(os.getenv("CACHE_IDLE_SECONDS", "10"))
+PURGE_LIMIT = 20000        # max expired rows deleted per pass
+
+_stop = threading.Event()
+_thread: Optional[threading.Thread] = None
+
+# last pass summary for /debug/cache
+_status: dict = {"runs": 0, "last_run": None, "last_error": None}
+_status_lock = threading.Lock()
+
+
+def run_once(db_path: str = cache_sqlite.DEFAULT_DB_PATH) -> dict:
+    result = {
+        "touched": cache_sqlite.flush_access(),
+        "purged": cache_sqlite.purge_expired(PURGE_LIMIT, CACHE_EXPIRED_GRACE_SECONDS, db_path=db_path),
+        "evicted": cache_sqlite.evict_to_size(CACHE_MAX_BYTES, db_path=db_path),
+        "vacuumed": False,
+        "converted": False,
+    }
+    if cache_sqlite.idle_seconds() >= CACHE_IDLE_SECONDS:
+        result["converted"] = cache_sqlite.enable_incremental_vacuum(db_path)
+        cache_sqlite.compact(db_path=db_path)
+        result["vacuumed"] = True
+    return result
+
+
+def _run():
+    while not _stop.wait(CACHE_JANITOR_SECONDS):
+        try:
+            result = run_once()
+            error = None
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        with _status_lock:
+            _status["runs"] += 1
+            _status["last_run"] = time.time()
+            _status["last_error"] = error
+            if result is not None:
+                _status["last_result"] = result
+
+
+def start():
+    global _thread
+    if _thread is not None and _thread.is_alive():
+        return
+    _stop.clear()
+    _thread = threading.Thread(target=_run, name="cache-janitor", daemon=True)
+    _thread.start()
+
+
+def stop(timeout: float = 5.0):
+    global _thread
+    _stop.set()
+    if _thread is not None:
+        _thread.join(timeout)
+    _thread = None
+
+
+def status() -> dict:
+    with _status_lock:
+        out = dict(_status)
+    out["running"] = _thread is not None and _thread.is_alive()
+    out["max_bytes"] = CACHE_MAX_BYTES
+    return out
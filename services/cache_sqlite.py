@@ -1,29 +1,173 @@
-import json
 import os
 import sqlite3
 import threading
 import time
+import zlib
+from collections import OrderedDict
 from contextlib import contextmanager
 from typing import Any, Optional, Tuple
 
+from services import singleflight
+from utils import codec
+
 DEFAULT_DB_PATH = os.getenv("CACHE_DB_PATH", "cache.sqlite3")
 
-_inflight: dict[str, threading.Lock] = {}
-_inflight_guard = threading.Lock()
+# Payload storage codec for new rows. Rows written before the payload_blob migration
+# (codec NULL) keep their TEXT payload_json and are read transparently.
+#   "zlib-json": compact JSON, zlib-compressed, in payload_blob (default)
+#   "json":      compact JSON text in payload_json (the legacy layout)
+CACHE_PAYLOAD_CODEC = os.getenv("CACHE_PAYLOAD_CODEC", "zlib-json")
+ZLIB_LEVEL = 6
+PURGE_BATCH = 500  # rows per expired-row delete transaction
+EVICT_BATCH = 50   # rows per size-cap eviction step (small, so we stop close to the cap)
+
+# Statements reused on every hit/refresh; sqlite3 keeps them compiled per connection.
+_SQL_GET = """
+    SELECT status_code, payload_json, payload_blob, codec, raw_size, fetched_at, expires_at, last_access
+    FROM http_cache WHERE cache_key=?
+"""
+_SQL_UPSERT = """
+    INSERT INTO http_cache(cache_key, status_code, payload_json, payload_blob, codec, raw_size, fetched_at, expires_at, last_access)
+    VALUES(?,?,?,?,?,?,?,?,?)
+    ON CONFLICT(cache_key) DO UPDATE SET
+      status_code=excluded.status_code,
+      payload_json=excluded.payload_json,
+      payload_blob=excluded.payload_blob,
+      codec=excluded.codec,
+      raw_size=excluded.raw_size,
+      fetched_at=excluded.fetched_at,
+      expires_at=excluded.expires_at,
+      last_access=excluded.last_access;
+"""
+_SQL_TOUCH = "UPDATE http_cache SET last_access=? WHERE cache_key=? AND last_access < ?"
+
+# last_access drives size-cap eviction. It is kept cheap: SQLite hits only write it when the
+# stored value is older than ACCESS_TOUCH_SECONDS, and L1 hits are collected in memory and
+# written in one batch by flush_access() (called from the cache janitor).
+ACCESS_TOUCH_SECONDS = 60
+# (db_path, cache_key) -> last access time
+_pending_access: dict[tuple[str, str], int] = {}
+_pending_access_lock = threading.Lock()
+_last_activity = 0.0  # monotonic time of the last get/set, so the janitor can tell when we're idle
+
+# One long-lived connection per (thread, db_path). Pragmas run once at connect.
+_local = threading.local()
+_conns: dict[tuple[int, str], tuple[threading.Thread, sqlite3.Connection]] = {}
+_conns_lock = threading.Lock()
+_generation = 0  # bumped by close_all() so threads reconnect afterwards
+
+# L1: in-process LRU of decoded payloads in front of SQLite (L2), capped by approximate bytes
+# (length of the stored JSON). Entries are shared between callers: treat payloads as read-only.
+L1_MAX_BYTES = int(os.getenv("CACHE_L1_MAX_BYTES", str(32 * 1024 * 1024)))
+# (db_path, cache_key) -> (status_code, payload, fetched_at, expires_at, size)
+_l1: "OrderedDict[tuple[str, str], tuple[int, Any, int, int, int]]" = OrderedDict()
+_l1_bytes = 0
+_l1_lock = threading.Lock()
 
 def _now() -> int:
     return int(time.time())
 
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False, cached_statements=32)
+    # Must precede journal_mode on a brand-new file; existing files are converted by
+    # enable_incremental_vacuum() once the janitor sees an idle moment.
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+    conn.execute("PRAGMA journal_mode=WAL;")
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    return conn
+
+def _conn(db_path: str) -> sqlite3.Connection:
+    conns = getattr(_local, "conns", None)
+    if conns is None or getattr(_local, "generation", None) != _generation:
+        conns = _local.conns = {}
+        _local.generation = _generation
+
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = conns[db_path] = _connect(db_path)
+        thread = threading.current_thread()
+        with _conns_lock:
+            # reap connections left behind by threads that have exited
+            for key in [k for k, (t, _) in _conns.items() if not t.is_alive()]:
+                _conns.pop(key)[1].close()
+            _conns[(thread.ident, db_path)] = (thread, conn)
+    return conn
+
 @contextmanager
 def _db(db_path: str = DEFAULT_DB_PATH):
-    conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+    conn = _conn(db_path)
     try:
-        conn.execute("PRAGMA journal_mode=WAL;")
-        conn.execute("PRAGMA synchronous=NORMAL;")
         yield conn
         conn.commit()
-    finally:
-        conn.close()
+    except BaseException:
+        conn.rollback()
+        raise
+
+def connection(db_path: str = DEFAULT_DB_PATH):
+    """
+    Transaction on this thread's persistent connection, for other modules that keep
+    their own tables in the cache DB (e.g. services/team_registry.py). Commits on exit.
+    """
+    return _db(db_path)
+
+def close_all():
+    """Close every cached connection (app shutdown). Threads reconnect lazily if used again."""
+    global _generation
+    with _conns_lock:
+        _generation += 1
+        for _, conn in _conns.values():
+            try:
+                conn.close()
+            except Exception:
+                pass
+        _conns.clear()
+
+def _l1_get(db_path: str, cache_key: str) -> Optional[Tuple[int, Any, int, int]]:
+    global _l1_bytes
+    key = (db_path, cache_key)
+    with _l1_lock:
+        hit = _l1.get(key)
+        if hit is None:
+            return None
+        if hit[3] < _now():
+            # expired: drop it and let L2 answer (another worker may have refreshed the row)
+            del _l1[key]
+            _l1_bytes -= hit[4]
+            return None
+        _l1.move_to_end(key)
+        return hit[:4]
+
+def _l1_put(db_path: str, cache_key: str, status_code: int, payload: Any, fetched_at: int, expires_at: int, size: int):
+    global _l1_bytes
+    if size > L1_MAX_BYTES:
+        return
+    key = (db_path, cache_key)
+    with _l1_lock:
+        old = _l1.pop(key, None)
+        if old is not None:
+            _l1_bytes -= old[4]
+        _l1[key] = (status_code, payload, fetched_at, expires_at, size)
+        _l1_bytes += size
+        while _l1_bytes > L1_MAX_BYTES and _l1:
+            _, evicted = _l1.popitem(last=False)
+            _l1_bytes -= evicted[4]
+
+def _l1_drop(db_path: str, cache_keys: list[str]):
+    """Forget L1 entries for rows deleted from SQLite, so they are not served from memory."""
+    global _l1_bytes
+    with _l1_lock:
+        for cache_key in cache_keys:
+            old = _l1.pop((db_path, cache_key), None)
+            if old is not None:
+                _l1_bytes -= old[4]
+
+def _delete_rows(conn: sqlite3.Connection, db_path: str, select_sql: str, params: tuple) -> int:
+    # DELETE ... LIMIT needs SQLITE_ENABLE_UPDATE_DELETE_LIMIT; deleting selected rowids works everywhere.
+    rows = conn.execute(select_sql, params).fetchall()
+    if rows:
+        conn.executemany("DELETE FROM http_cache WHERE rowid=?", [(rowid,) for rowid, _ in rows])
+        _l1_drop(db_path, [cache_key for _, cache_key in rows])
+    return len(rows)
 
 def init_cache(db_path: str = DEFAULT_DB_PATH):
     with _db(db_path) as conn:
@@ -39,78 +183,282 @@ def init_cache(db_path: str = DEFAULT_DB_PATH):
             """
         )
         conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_expires ON http_cache(expires_at);")
+        _migrate(conn)
+
+def _migrate(conn: sqlite3.Connection):
+    """Add columns introduced after the original schema (safe to run from several workers)."""
+    have = {row[1] for row in conn.execute("PRAGMA table_info(http_cache);")}
+    for name, decl in (("payload_blob", "BLOB"), ("codec", "TEXT"), ("raw_size", "INTEGER"), ("last_access", "INTEGER")):
+        if name in have:
+            continue
+        try:
+            conn.execute(f"ALTER TABLE http_cache ADD COLUMN {name} {decl};")
+        except sqlite3.OperationalError as e:
+            if "duplicate column" not in str(e).lower():
+                raise
+        if name == "last_access":
+            conn.execute("UPDATE http_cache SET last_access=fetched_at WHERE last_access IS NULL;")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_last_access ON http_cache(last_access);")
+
+def _encode_payload(payload: Any) -> tuple[str, Optional[bytes], Optional[str], int]:
+    """-> (payload_json, payload_blob, codec, raw_size)"""
+    raw = codec.dumps(payload)
+    if CACHE_PAYLOAD_CODEC == "zlib-json":
+        return "", zlib.compress(raw, ZLIB_LEVEL), "zlib-json", len(raw)
+    return raw.decode("utf-8"), None, None, len(raw)
+
+def _decode_payload(payload_json: Optional[str], payload_blob: Optional[bytes], codec_tag: Optional[str]) -> Any:
+    if codec_tag == "zlib-json":
+        return codec.loads(zlib.decompress(payload_blob))
+    if codec_tag is None:
+        return codec.loads(payload_json)
+    raise ValueError(f"unknown cache payload codec {codec_tag!r}")
+
+def _note_access(db_path: str, cache_key: str, now: int):
+    with _pending_access_lock:
+        _pending_access[(db_path, cache_key)] = now
+
+def flush_access() -> int:
+    """Write last_access for L1 hits collected since the previous flush. Returns rows touched."""
+    with _pending_access_lock:
+        if not _pending_access:
+            return 0
+        pending = dict(_pending_access)
+        _pending_access.clear()
+
+    by_db: dict[str, list] = {}
+    for (db_path, cache_key), ts in pending.items():
+        by_db.setdefault(db_path, []).append((ts, cache_key, ts - ACCESS_TOUCH_SECONDS))
+    for db_path, rows in by_db.items():
+        with _db(db_path) as conn:
+            conn.executemany(_SQL_TOUCH, rows)
+    return len(pending)
+
+def idle_seconds() -> float:
+    return time.monotonic() - _last_activity
 
 def get_cached(cache_key: str, db_path: str = DEFAULT_DB_PATH) -> Optional[Tuple[int, Any, int, int]]:
+    global _last_activity
+    _last_activity = time.monotonic()
+    hit = _l1_get(db_path, cache_key)
+    if hit is not None:
+        _note_access(db_path, cache_key, _now())
+        return hit
+
+    now = _now()
     with _db(db_path) as conn:
-        row = conn.execute(
-            "SELECT status_code, payload_json, fetched_at, expires_at FROM http_cache WHERE cache_key=?",
-            (cache_key,),
-        ).fetchone()
+        row = conn.execute(_SQL_GET, (cache_key,)).fetchone()
+        if row and (row[7] or 0) < now - ACCESS_TOUCH_SECONDS:
+            conn.execute(_SQL_TOUCH, (now, cache_key, now - ACCESS_TOUCH_SECONDS))
     if not row:
         return None
-    status_code, payload_json, fetched_at, expires_at = row
+    status_code, payload_json, payload_blob, codec_tag, raw_size, fetched_at, expires_at, _ = row
     try:
-        payload = json.loads(payload_json)
+        payload = _decode_payload(payload_json, payload_blob, codec_tag)
     except Exception:
         return None
+    if expires_at >= _now():
+        size = raw_size if raw_size is not None else len(payload_json or "")
+        _l1_put(db_path, cache_key, status_code, payload, fetched_at, expires_at, size)
     return status_code, payload, fetched_at, expires_at
 
 def set_cached(cache_key: str, status_code: int, payload: Any, ttl_seconds: int, db_path: str = DEFAULT_DB_PATH):
+    global _last_activity
+    _last_activity = time.monotonic()
     now = _now()
     expires_at = now + max(1, int(ttl_seconds))
-    payload_json = json.dumps(payload, separators=(",", ":"))
+    payload_json, payload_blob, codec_tag, raw_size = _encode_payload(payload)
     with _db(db_path) as conn:
-        conn.execute(
-            """
-            INSERT INTO http_cache(cache_key, status_code, payload_json, fetched_at, expires_at)
-            VALUES(?,?,?,?,?)
-            ON CONFLICT(cache_key) DO UPDATE SET
-              status_code=excluded.status_code,
-              payload_json=excluded.payload_json,
-              fetched_at=excluded.fetched_at,
-              expires_at=excluded.expires_at;
-            """,
-            (cache_key, status_code, payload_json, now, expires_at),
-        )
+        conn.execute(_SQL_UPSERT, (cache_key, status_code, payload_json, payload_blob, codec_tag, raw_size, now, expires_at, now))
+    _l1_put(db_path, cache_key, status_code, payload, now, expires_at, raw_size)
 
-def purge_expired(limit: int = 5000, db_path: str = DEFAULT_DB_PATH):
-    now = _now()
+def cache_stats(db_path: str = DEFAULT_DB_PATH) -> dict:
+    """Row counts per codec, raw vs stored payload bytes (compression ratio), file and L1 size."""
     with _db(db_path) as conn:
-        conn.execute("DELETE FROM http_cache WHERE expires_at < ? LIMIT ?", (now, limit))
+        rows = conn.execute(
+            """
+            SELECT COALESCE(codec, 'legacy-json'),
+                   COUNT(*),
+                   SUM(COALESCE(raw_size, LENGTH(CAST(payload_json AS BLOB)))),
+                   SUM(COALESCE(LENGTH(payload_blob), 0) + LENGTH(CAST(payload_json AS BLOB)))
+            FROM http_cache GROUP BY 1
+            """
+        ).fetchall()
+        page_count = conn.execute("PRAGMA page_count;").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size;").fetchone()[0]
+
+    by_codec = {}
+    raw_total = stored_total = 0
+    for tag, count, raw, stored in rows:
+        raw, stored = int(raw or 0), int(stored or 0)
+        raw_total += raw
+        stored_total += stored
+        by_codec[tag] = {
+            "rows": count,
+            "raw_bytes": raw,
+            "stored_bytes": stored,
+            "ratio": round(raw / stored, 2) if stored else None,
+        }
+    with _l1_lock:
+        l1 = {"entries": len(_l1), "bytes": _l1_bytes, "max_bytes": L1_MAX_BYTES}
+    return {
+        "codec": CACHE_PAYLOAD_CODEC,
+        "rows": sum(c["rows"] for c in by_codec.values()),
+        "raw_bytes": raw_total,
+        "stored_bytes": stored_total,
+        "ratio": round(raw_total / stored_total, 2) if stored_total else None,
+        "db_bytes": page_count * page_size,
+        "by_codec": by_codec,
+        "l1": l1,
+    }
+
+def purge_expired(limit: int = 5000, grace_seconds: int = 0, db_path: str = DEFAULT_DB_PATH) -> int:
+    """
+    Delete up to `limit` rows that expired more than `grace_seconds` ago, in small
+    transactions so readers are never blocked for long. The grace period keeps
+    recently expired rows around for stale-while-revalidate / stale-on-error.
+    Returns the number of rows deleted.
+    """
+    cutoff = _now() - max(0, int(grace_seconds))
+    deleted = 0
+    while deleted < limit:
+        batch = min(PURGE_BATCH, limit - deleted)
+        with _db(db_path) as conn:
+            n = _delete_rows(
+                conn, db_path,
+                "SELECT rowid, cache_key FROM http_cache WHERE expires_at < ? LIMIT ?",
+                (cutoff, batch),
+            )
+        deleted += n
+        if n < batch:
+            break
+    return deleted
+
+def _used_bytes(conn: sqlite3.Connection) -> int:
+    page_size = conn.execute("PRAGMA page_size;").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count;").fetchone()[0]
+    free = conn.execute("PRAGMA freelist_count;").fetchone()[0]
+    return (page_count - free) * page_size
+
+def evict_to_size(max_bytes: int, db_path: str = DEFAULT_DB_PATH) -> int:
+    """
+    Delete least-recently accessed rows until the live (non-free) pages fit in
+    max_bytes. Returns the number of rows deleted.
+    """
+    if max_bytes <= 0:
+        return 0
+    deleted = 0
+    while True:
+        with _db(db_path) as conn:
+            if _used_bytes(conn) <= max_bytes:
+                break
+            n = _delete_rows(
+                conn, db_path,
+                "SELECT rowid, cache_key FROM http_cache ORDER BY last_access LIMIT ?",
+                (EVICT_BATCH,),
+            )
+        deleted += n
+        if n == 0:
+            break
+    return deleted
 
-def _lock_for_key(cache_key: str) -> threading.Lock:
-    with _inflight_guard:
-        lock = _inflight.get(cache_key)
-        if lock is None:
-            lock = threading.Lock()
-            _inflight[cache_key] = lock
-        return lock
+def enable_incremental_vacuum(db_path: str = DEFAULT_DB_PATH) -> bool:
+    """
+    One-time switch of an existing file to auto_vacuum=INCREMENTAL (needs a full
+    VACUUM, so only call it while idle). Returns True if the file was converted.
+    """
+    conn = _conn(db_path)
+    if conn.execute("PRAGMA auto_vacuum;").fetchone()[0] == 2:
+        return False
+    conn.commit()
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL;")
+    conn.execute("VACUUM;")
+    return True
+
+def compact(pages: int = 2000, db_path: str = DEFAULT_DB_PATH):
+    """Return up to `pages` free pages to the OS and truncate the WAL."""
+    conn = _conn(db_path)
+    # executescript steps the pragma to completion; execute() would free a single page
+    conn.executescript(f"PRAGMA incremental_vacuum({int(pages)}); PRAGMA wal_checkpoint(TRUNCATE);")
+
+_revalidating: set[str] = set()
+_revalidating_lock = threading.Lock()
+
+def _fetch_and_store(cache_key: str, ttl_seconds: int, fetch_fn, db_path: str):
+    sc, payload = fetch_fn()
+    # caller can decide to only call set_cached on good responses,
+    # but typical usage: do it here only for sc==200 (caller checks)
+    if sc == 200:
+        set_cached(cache_key, sc, payload, ttl_seconds, db_path=db_path)
+    return sc, payload, "origin", _now()
+
+def _revalidate_in_background(flight_key: str, cache_key: str, ttl_seconds: int, fetch_fn, db_path: str):
+    with _revalidating_lock:
+        if flight_key in _revalidating:
+            return
+        _revalidating.add(flight_key)
+
+    def run():
+        try:
+            singleflight.do(flight_key, lambda: _fetch_and_store(cache_key, ttl_seconds, fetch_fn, db_path))
+        except Exception:
+            pass  # the stale row keeps being served; the next request past the soft TTL retries
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(flight_key)
 
-def cached_call(cache_key: str, ttl_seconds: int, fetch_fn, *, db_path: str = DEFAULT_DB_PATH):
+    threading.Thread(target=run, name=f"revalidate:{cache_key}", daemon=True).start()
+
+def cached_call(cache_key: str, ttl_seconds: int, fetch_fn, *, stale_ttl_seconds: int = 0, db_path: str = DEFAULT_DB_PATH):
     """
     fetch_fn must return: (status_code:int, payload:any)
     Only caches successful fetches; caller decides what "successful" means.
+
+    Returns (status_code, payload, source, fetched_at). source is one of:
+      "cache"        fresh row (younger than ttl_seconds, the soft TTL)
+      "stale"        past the soft TTL but within stale_ttl_seconds more (the hard TTL);
+                     served immediately while one background refresh runs
+      "origin"       fetched now
+      "stale-error"  the origin fetch failed, so the last good row (any age) was served
     """
+    flight_key = f"cache:{db_path}:{cache_key}"
     cached = get_cached(cache_key, db_path)
     now = _now()
     if cached:
         sc, payload, fetched_at, expires_at = cached
         if expires_at >= now:
-            return sc, payload, "cache"
+            return sc, payload, "cache", fetched_at
+        if expires_at + stale_ttl_seconds >= now:
+            _revalidate_in_background(flight_key, cache_key, ttl_seconds, fetch_fn, db_path)
+            return sc, payload, "stale", fetched_at
 
-    lock = _lock_for_key(cache_key)
-    with lock:
-        # Re-check inside lock (another request may have refreshed it)
+    def load():
+        # Re-check inside the flight (a previous flight may have just refreshed it)
         cached2 = get_cached(cache_key, db_path)
         now2 = _now()
         if cached2:
-            sc2, payload2, _, expires_at2 = cached2
+            sc2, payload2, fetched_at2, expires_at2 = cached2
             if expires_at2 >= now2:
-                return sc2, payload2, "cache"
-
-        sc, payload = fetch_fn()
-        # caller can decide to only call set_cached on good responses,
-        # but typical usage: do it here only for sc==200 (caller checks)
-        if sc == 200:
-            set_cached(cache_key, sc, payload, ttl_seconds, db_path=db_path)
-        return sc, payload, "origin"
+                return sc2, payload2, "cache", fetched_at2
+
+        try:
+            result = _fetch_and_store(cache_key, ttl_seconds, fetch_fn, db_path)
+        except Exception:
+            if cached2:
+                return cached2[0], cached2[1], "stale-error", cached2[2]
+            raise
+        if result[0] != 200 and cached2:
+            return cached2[0], cached2[1], "stale-error", cached2[2]
+        return result
+
+    # Concurrent misses for the same key share one origin fetch. The flight may be a
+    # background revalidation (which has no stale fallback), so apply the fallback here too.
+    try:
+        result = singleflight.do(flight_key, load)
+    except Exception:
+        if cached:
+            return cached[0], cached[1], "stale-error", cached[2]
+        raise
+    if result[0] != 200 and result[2] == "origin" and cached:
+        return cached[0], cached[1], "stale-error", cached[2]
+    return result
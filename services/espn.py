@@ -1,7 +1,12 @@
 # services/espn.py
-import requests
+import hashlib
+import threading
+import time
+
 from fastapi import HTTPException
 from normalize import matchup_key
+from services import singleflight, upstream
+from utils import codec
 
 ESPN_SCOREBOARD_URLS = {
     "cbb": "https://site.api.espn.com/apis/site/v2/sports/basketball/mens-college-basketball/scoreboard",
@@ -9,17 +14,30 @@ ESPN_SCOREBOARD_URLS = {
     "nfl": "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard",
 }
 
+# Scoreboard cache TTLs (seconds), chosen by slate state.
+SCOREBOARD_TTL_LIVE = 5                  # any game in progress
+SCOREBOARD_TTL_PRE = 120                 # nothing live yet (or between windows)
+SCOREBOARD_TTL_FINAL = 60 * 60 * 24 * 7  # every game final: effectively forever
+SCOREBOARD_CACHE_MAX_ENTRIES = 64
+
+# (sport, date_espn) -> {"raw", "games", "hash", "fetched_at", "expires_at"}
+_scoreboard_cache: dict[tuple[str, str], dict] = {}
+_scoreboard_cache_lock = threading.Lock()
+
 def _scoreboard_url_for_sport(sport: str) -> str:
     return ESPN_SCOREBOARD_URLS.get(sport, ESPN_SCOREBOARD_URLS["cbb"])
 
 def fetch_scoreboard(date_espn: str, sport: str = "cbb") -> dict:
+    return codec.response_json(_fetch_scoreboard_response(date_espn, sport))
+
+def _fetch_scoreboard_response(date_espn: str, sport: str):
     url = _scoreboard_url_for_sport(sport)
     params = {"dates": date_espn, "limit": 500}
     if sport == "cbb":
         # ESPN group 50 is Men\'s D-I basketball; keep this for CBB only.
         params["groups"] = 50
     try:
-        r = requests.get(url, params=params, timeout=15)
+        r = upstream.get(url, params=params, timeout=15)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"ESPN request failed: {type(e).__name__}: {e}")
 
@@ -28,7 +46,7 @@ def fetch_scoreboard(date_espn: str, sport: str = "cbb") -> dict:
             status_code=500,
             detail={"source": "espn", "requested_url": r.url, "status_code": r.status_code, "body_preview": r.text[:800]},
         )
-    return r.json()
+    return r
 
 def _extract_conference(team: dict) -> dict:
     """
@@ -181,12 +199,76 @@ def espn_game_url(event_id: str | None, sport: str = "cbb") -> str:
         return f"https://www.espn.com/nfl/game?gameId={event_id}"
     return f"https://www.espn.com/mens-college-basketball/game?gameId={event_id}"
 
+def _scoreboard_ttl(games: list[dict]) -> int:
+    states = {g.get("status_state") for g in games}
+    if "in" in states:
+        return SCOREBOARD_TTL_LIVE
+    if games and states == {"post"}:
+        return SCOREBOARD_TTL_FINAL
+    return SCOREBOARD_TTL_PRE
+
+def _prune_scoreboard_cache(now: float):
+    # caller holds _scoreboard_cache_lock
+    for key in [k for k, v in _scoreboard_cache.items() if v["expires_at"] < now]:
+        del _scoreboard_cache[key]
+    overflow = len(_scoreboard_cache) - SCOREBOARD_CACHE_MAX_ENTRIES
+    if overflow > 0:
+        oldest = sorted(_scoreboard_cache, key=lambda k: _scoreboard_cache[k]["fetched_at"])
+        for key in oldest[:overflow]:
+            del _scoreboard_cache[key]
+
+def get_scoreboard(date_espn: str, sport: str = "cbb") -> dict:
+    """
+    Cached scoreboard entry for (sport, date): {"raw", "games", "hash", "fetched_at", "expires_at"}
+    (+ "urls_by_event_id" once urls_by_event_id() has run for it).
+    "games" is the parse_games output. Both are shared between callers; treat them as read-only.
+    "hash" is a digest of the response body, so callers can tell an unchanged refetch apart.
+    """
+    key = (sport, date_espn)
+    with _scoreboard_cache_lock:
+        entry = _scoreboard_cache.get(key)
+    if entry and entry["expires_at"] > time.time():
+        return entry
+
+    def load() -> dict:
+        with _scoreboard_cache_lock:
+            fresh = _scoreboard_cache.get(key)
+        if fresh and fresh["expires_at"] > time.time():
+            return fresh
+
+        r = _fetch_scoreboard_response(date_espn, sport)
+        raw = codec.response_json(r)
+        games = parse_games(raw)
+        fetched_at = time.time()
+        new_entry = {
+            "raw": raw,
+            "games": games,
+            "hash": hashlib.blake2b(r.content, digest_size=16).hexdigest(),
+            "fetched_at": fetched_at,
+            "expires_at": fetched_at + _scoreboard_ttl(games),
+        }
+        with _scoreboard_cache_lock:
+            _scoreboard_cache[key] = new_entry
+            _prune_scoreboard_cache(fetched_at)
+        return new_entry
+
+    return singleflight.do(f"espn:scoreboard:{sport}:{date_espn}", load)
+
+def scoreboard_games(date_espn: str, sport: str = "cbb") -> list[dict]:
+    return get_scoreboard(date_espn, sport)["games"]
+
 def urls_by_event_id(date_espn: str, sport: str = "cbb") -> dict[str, str]:
-    data = fetch_scoreboard(date_espn, sport)
+    entry = get_scoreboard(date_espn, sport)
+    # Built once per cached scoreboard entry; unchanged entries return the same dict.
+    cached = entry.get("urls_by_event_id")
+    if cached is not None:
+        return cached
+
     out: dict[str, str] = {}
-    for ev in (data.get("events") or []):
-        event_id = ev.get("id")
+    for g in entry["games"]:
+        event_id = g.get("event_id")
         if event_id:
             sid = str(event_id)
             out[sid] = espn_game_url(sid, sport)
+    entry["urls_by_event_id"] = out
     return out
@@ -0,0 +1,69 @@
+# services/fuzzy_match.py
+"""
+Last-resort ESPN -> KenPom matching by character-trigram similarity.
+
+Only used for the few ESPN games the exact/team-id matching leaves over: the
+index is built over the KenPom rows nobody claimed, and each leftover game is
+scored against the rows that share at least one trigram with its teams, so the
+cost scales with the unmatched remainder rather than the slate.
+"""
+import os
+from typing import Optional
+
+from normalize import normalize_team
+
+FUZZY_MATCH_THRESHOLD = float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.6"))
+MAX_CANDIDATES = 20  # rows scored per leftover game (most shared trigrams first)
+
+
+def trigrams(name: str) -> frozenset[str]:
+    s = f"  {name} "
+    return frozenset(s[i:i + 3] for i in range(len(s) - 2))
+
+
+def similarity(a: frozenset[str], b: frozenset[str]) -> float:
+    """Dice coefficient; kinder than Jaccard to suffix differences ("x" vs "x state")."""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def build_index(kp_rows: list[dict]) -> dict:
+    """{"rows": [(row, visitor trigrams, home trigrams)], "postings": {trigram: {row index}}}"""
+    rows = []
+    postings: dict[str, set[int]] = {}
+    for g in kp_rows:
+        v = trigrams(normalize_team(g.get("Visitor")))
+        h = trigrams(normalize_team(g.get("Home")))
+        idx = len(rows)
+        rows.append((g, v, h))
+        for t in v | h:
+            postings.setdefault(t, set()).add(idx)
+    return {"rows": rows, "postings": postings}
+
+
+def candidates(index: dict, away: Optional[str], home: Optional[str], threshold: float = FUZZY_MATCH_THRESHOLD) -> list[tuple[dict, bool, float]]:
+    """
+    KenPom rows scoring at least `threshold` for this ESPN matchup, as (row, flipped, score).
+    The score is the mean trigram similarity of the two teams, taking whichever
+    orientation (as listed, or home/away swapped) scores higher.
+    """
+    a = trigrams(normalize_team(away))
+    h = trigrams(normalize_team(home))
+
+    shared: dict[int, int] = {}
+    for t in a | h:
+        for idx in index["postings"].get(t, ()):
+            shared[idx] = shared.get(idx, 0) + 1
+    top = sorted(shared, key=shared.__getitem__, reverse=True)[:MAX_CANDIDATES]
+
+    out = []
+    for idx in top:
+        row, kv, kh = index["rows"][idx]
+        straight = (similarity(a, kv) + similarity(h, kh)) / 2
+        flipped = (similarity(a, kh) + similarity(h, kv)) / 2
+        score, is_flipped = (flipped, True) if flipped > straight else (straight, False)
+        if score >= threshold:
+            out.append((row, is_flipped, score))
+    return out
+
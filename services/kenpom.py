@@ -1,8 +1,9 @@
 import os
-import requests
 from fastapi import HTTPException
 from utils.dates import kp_date
+from services import upstream
 from services.cache_sqlite import init_cache, cached_call
+from utils import codec
 
 KENPOM_API_URL = "https://kenpom.com/api.php"
 
@@ -26,7 +27,24 @@ def _ttl_seconds(date_yyyy_mm_dd: str) -> int:
         return 90  # 90s for today
     return 60 * 60 * 24 * 14  # 14 days for past dates
 
+def _stale_ttl_seconds(date_yyyy_mm_dd: str) -> int:
+    """
+    How long past the soft TTL a cached row is still served instantly while it revalidates.
+    (On origin errors the last good row is served regardless of age.)
+    """
+    if _ttl_seconds(date_yyyy_mm_dd) <= 90:
+        return 60 * 15  # today: predictions barely move within 15 minutes
+    return 60 * 60 * 24
+
 def fetch_fanmatch(date_kp: str) -> list[dict]:
+    data, _ = fetch_fanmatch_with_meta(date_kp)
+    return data
+
+def fetch_fanmatch_with_meta(date_kp: str) -> tuple[list[dict], dict]:
+    """
+    Same as fetch_fanmatch, plus {"source", "fetched_at"} from cached_call so callers can
+    flag stale data ("stale" while revalidating, "stale-error" when KenPom is failing).
+    """
     api_key = os.getenv("KENPOM_API_KEY")
     if not api_key:
         raise HTTPException(status_code=500, detail="KENPOM_API_KEY is missing")
@@ -41,7 +59,7 @@ def fetch_fanmatch(date_kp: str) -> list[dict]:
 
     def fetch_fn():
         try:
-            r = requests.get(KENPOM_API_URL, params=params, headers=headers, timeout=15)
+            r = upstream.get(KENPOM_API_URL, params=params, headers=headers, timeout=15)
         except Exception as e:
             # Don't cache exceptions; bubble as 500
             raise HTTPException(status_code=500, detail=f"KenPom request failed: {type(e).__name__}: {e}")
@@ -51,7 +69,7 @@ def fetch_fanmatch(date_kp: str) -> list[dict]:
             body_text = r.text or ""
             no_games = False
             try:
-                err = r.json()
+                err = codec.response_json(r)
                 if isinstance(err, dict) and "error" in err and "No games found for the specified date" in err["error"]:
                     no_games = True
             except Exception:
@@ -66,7 +84,7 @@ def fetch_fanmatch(date_kp: str) -> list[dict]:
                 detail={"source": "kenpom", "requested_url": r.url, "status_code": r.status_code, "body_preview": r.text[:800]},
             )
         try:
-            data = r.json()
+            data = codec.response_json(r)
         except Exception as ex:
             raise HTTPException(
                 status_code=500,
@@ -75,10 +93,10 @@ def fetch_fanmatch(date_kp: str) -> list[dict]:
             )
         return 200, data
 
-    _, data, _ = cached_call(cache_key, ttl, fetch_fn)
+    _, data, source, fetched_at = cached_call(cache_key, ttl, fetch_fn, stale_ttl_seconds=_stale_ttl_seconds(d))
 
     # cached_call only caches status==200; still validate shape
     if not isinstance(data, list):
         raise HTTPException(status_code=500, detail={"source": "kenpom", "error": "KenPom expected list", "type": str(type(data)), "data_preview": data})
 
-    return data
+    return data, {"source": source, "fetched_at": fetched_at}
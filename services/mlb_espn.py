@@ -1,13 +1,64 @@
 # services/mlb_espn_scoreboard.py
 from __future__ import annotations
 
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Any, Dict, List, Optional
-import requests
+
+from services import upstream
+from utils import codec
 
 SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
 SUMMARY_URL = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/summary"
 REQUEST_HEADERS = {"User-Agent": "cbb-dashboard/1.0"}
 
+# Extracted summary results ({"probables", "live", "decisions"} or None) per (event, state),
+# and for live games per situation fingerprint too, so a new batter/pitch never gets an older summary.
+# A final game's summary is settled once its decisions are posted (a few minutes after the
+# last out, so until then it is rechecked like an empty one); probables move rarely before first pitch.
+SUMMARY_TTL_POST = 60 * 60 * 24
+SUMMARY_TTL_PRE = 300
+SUMMARY_TTL_IN = 10
+SUMMARY_TTL_EMPTY = 30          # summary had nothing useful yet (e.g. decisions not posted)
+SUMMARY_CACHE_MAX_ENTRIES = 512
+
+# (event_id, state, fingerprint or None) -> {"result", "expires_at"}
+_summary_cache: Dict[tuple, Dict[str, Any]] = {}
+_summary_cache_lock = threading.Lock()
+
+# One process-wide pool for summary lookups: a global cap on concurrent summary requests,
+# and one in-flight future per (event, state) shared by every caller that needs it.
+MLB_SUMMARY_WORKERS = int(os.getenv("MLB_SUMMARY_WORKERS", "8"))
+# How long get_mlb_games waits for summaries before answering with scoreboard data only
+# ("TBA" probables / partial live). Late results still land in the cache for the next poll.
+MLB_SUMMARY_DEADLINE_SECONDS = float(os.getenv("MLB_SUMMARY_DEADLINE_SECONDS", "4"))
+_summary_pool = ThreadPoolExecutor(max_workers=MLB_SUMMARY_WORKERS, thread_name_prefix="mlb-summary")
+_summary_pending: Dict[tuple, Future] = {}
+_summary_pending_lock = threading.Lock()
+
+# Live games: the last scoreboard situation fingerprint per event plus the summary
+# enrichment that went with it. While the fingerprint is unchanged (same pitch count,
+# bases, outs, last play) the enrichment is re-applied instead of fetching the summary.
+LIVE_MEMORY_MAX_AGE_SECONDS = 120   # refetch anyway after this long, e.g. a mound visit with no new play
+LIVE_MEMORY_MAX_ENTRIES = 256
+# event_id -> {"fingerprint", "enrichment", "at"}
+_live_memory: Dict[str, Dict[str, Any]] = {}
+_live_memory_lock = threading.Lock()
+
+# Slate date of every event seen by get_mlb_games, so /mlb/games/{event_id}/live can
+# read the right slate for events that are not on today's.
+EVENT_DATES_MAX_ENTRIES = 1024
+_event_dates: Dict[str, str] = {}
+_event_dates_lock = threading.Lock()
+
+# Last live view per event and the situation it was built from: an unchanged game hands
+# back the same object, so the ETag memo can reuse the encoded body.
+# event_id -> (fingerprint, view)
+_live_views: Dict[str, tuple] = {}
+_live_views_lock = threading.Lock()
+
 def mlb_game_url(event_id: str | None) -> str:
     if not event_id:
         return ""
@@ -114,32 +165,6 @@ def _extract_decisions_from_status(status_obj: Any) -> Optional[Dict[str, Dict[s
     return out or None
 
 
-def _player_name_map_from_summary(summary_obj: Any) -> Dict[str, str]:
-    out: Dict[str, str] = {}
-    if not isinstance(summary_obj, dict):
-        return out
-
-    box = summary_obj.get("boxscore") or {}
-    players = box.get("players") or []
-    for team_group in players:
-        if not isinstance(team_group, dict):
-            continue
-        for stat_group in team_group.get("statistics") or []:
-            if not isinstance(stat_group, dict):
-                continue
-            for row in stat_group.get("athletes") or []:
-                if not isinstance(row, dict):
-                    continue
-                athlete = row.get("athlete") or {}
-                if not isinstance(athlete, dict):
-                    continue
-                pid = athlete.get("id")
-                name = athlete.get("displayName") or athlete.get("fullName") or athlete.get("shortName")
-                if pid and name:
-                    out[str(pid)] = str(name)
-    return out
-
-
 def _inning_half_from_text(text: Any) -> Optional[str]:
     s = str(text or "").strip().lower()
     if s.startswith("top"):
@@ -153,76 +178,6 @@ def _inning_half_from_text(text: Any) -> Optional[str]:
     return None
 
 
-def _infer_pitcher_from_summary(summary_obj: Any, inning_half: Optional[str]) -> Optional[Dict[str, Any]]:
-    if not isinstance(summary_obj, dict):
-        return None
-
-    header_comp = ((summary_obj.get("header") or {}).get("competitions") or [{}])[0]
-    competitors = (header_comp or {}).get("competitors") or []
-    if not competitors:
-        return None
-
-    home_team_id = None
-    away_team_id = None
-    for c in competitors:
-        if not isinstance(c, dict):
-            continue
-        side = c.get("homeAway")
-        tid = ((c.get("team") or {}).get("id"))
-        if side == "home":
-            home_team_id = str(tid) if tid is not None else None
-        elif side == "away":
-            away_team_id = str(tid) if tid is not None else None
-
-    defense_team_id = None
-    ih = str(inning_half or "").lower()
-    if ih == "top":
-        defense_team_id = home_team_id
-    elif ih == "bottom":
-        defense_team_id = away_team_id
-
-    active_pitcher_by_team: Dict[str, Dict[str, Any]] = {}
-    for team_group in ((summary_obj.get("boxscore") or {}).get("players") or []):
-        if not isinstance(team_group, dict):
-            continue
-        team_id = (team_group.get("team") or {}).get("id")
-        if team_id is None:
-            continue
-        team_id = str(team_id)
-
-        for stat_group in team_group.get("statistics") or []:
-            if not isinstance(stat_group, dict):
-                continue
-            if str(stat_group.get("type") or "").lower() != "pitching":
-                continue
-
-            for row in stat_group.get("athletes") or []:
-                if not isinstance(row, dict):
-                    continue
-                if not bool(row.get("active")):
-                    continue
-                athlete = row.get("athlete") or {}
-                if not isinstance(athlete, dict):
-                    continue
-                name = athlete.get("displayName") or athlete.get("fullName") or athlete.get("shortName")
-                pid = athlete.get("id")
-                if not name:
-                    continue
-                active_pitcher_by_team[team_id] = {
-                    "id": pid,
-                    "name": name,
-                }
-                break
-
-    if defense_team_id and defense_team_id in active_pitcher_by_team:
-        return active_pitcher_by_team[defense_team_id]
-
-    # Fallback: if we only found one active pitcher, use it.
-    if len(active_pitcher_by_team) == 1:
-        return next(iter(active_pitcher_by_team.values()))
-    return None
-
-
 def _live_from_situation(sit: Any, player_name_by_id: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
     if not isinstance(sit, dict):
         return None
@@ -317,91 +272,309 @@ def _has_due_up_names(live: Optional[Dict[str, Any]]) -> bool:
     return False
 
 
-def _find_probables_in_obj(obj: Any) -> Dict[str, Optional[Dict[str, Any]]]:
-    """Recursively search a JSON-like object for probable/probables entries.
+_PROBABLE_KEYS = frozenset(("probablepitcher", "probable", "probables", "probablepitchers", "projectedpitcher"))
+
+
+def _take_probables(v: Any, side_ctx: Optional[str], out: Dict[str, Optional[Dict[str, Any]]]) -> None:
+    """Fill out["home"]/out["away"] (first one wins) from a probable/probables value (dict or list)."""
+    items = [v] if isinstance(v, dict) else (v if isinstance(v, list) else [])
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        side = item.get("homeAway") or item.get("homeaway") or side_ctx
+        athlete = item.get("athlete") or item.get("player") or item
+        parsed = _extract_probable_name_id(athlete, item.get("playerId"))
+        if side == "home" and not out["home"] and parsed:
+            out["home"] = parsed
+        if side == "away" and not out["away"] and parsed:
+            out["away"] = parsed
 
-    Returns a dict with optional 'home' and 'away' entries like {"home": {id,name}, "away": ...}
-    """
-    out = {"home": None, "away": None}
 
-    def _recurse(o: Any, side_ctx: Optional[str] = None) -> None:
-        if o is None:
-            return
+def _walk_probables(obj: Any, out: Dict[str, Optional[Dict[str, Any]]]) -> None:
+    """
+    Depth-first search of a JSON-like object for probable/probables entries, in the same
+    order as a recursive walk (a key is checked before its value is descended into), with
+    an explicit stack and an early stop once both sides are found.
+    """
+    stack: List[tuple] = [(False, obj, None)]
+    while stack and not (out["home"] and out["away"]):
+        is_probe, o, side_ctx = stack.pop()
+        if is_probe:
+            _take_probables(o, side_ctx, out)
+            continue
         if isinstance(o, dict):
-            next_side_ctx = side_ctx
             o_side = o.get("homeAway") or o.get("homeaway")
             if o_side in ("home", "away"):
-                next_side_ctx = o_side
+                side_ctx = o_side
+            for k, v in reversed(list(o.items())):
+                stack.append((False, v, side_ctx))
+                if k and str(k).lower() in _PROBABLE_KEYS:
+                    stack.append((True, v, side_ctx))
+        elif isinstance(o, list):
+            stack.extend((False, i, side_ctx) for i in reversed(o))
+
+
+def _extract_summary(summary_obj: Any) -> Dict[str, Any]:
+    """
+    One pass over the parts of an MLB summary we use:
+      probables        {"home", "away"}: header competitors' probables first; only if a side
+                       is still missing, a depth-first walk of the whole document
+      player_names     {athlete id: name} from the boxscore
+      active_pitchers  {team id: {id, name}}: first active pitcher per boxscore pitching group
+      home_team_id / away_team_id, header_comp
+    """
+    out: Dict[str, Any] = {
+        "probables": {"home": None, "away": None},
+        "player_names": {},
+        "active_pitchers": {},
+        "home_team_id": None,
+        "away_team_id": None,
+        "header_comp": {},
+    }
+    if not isinstance(summary_obj, dict):
+        return out
+
+    probables = out["probables"]
+    header_comp = ((summary_obj.get("header") or {}).get("competitions") or [{}])[0] or {}
+    out["header_comp"] = header_comp
+    for c in header_comp.get("competitors") or []:
+        if not isinstance(c, dict):
+            continue
+        side = c.get("homeAway")
+        tid = (c.get("team") or {}).get("id")
+        if side == "home":
+            out["home_team_id"] = str(tid) if tid is not None else None
+        elif side == "away":
+            out["away_team_id"] = str(tid) if tid is not None else None
+        for k, v in c.items():
+            if k and str(k).lower() in _PROBABLE_KEYS:
+                _take_probables(v, side if side in ("home", "away") else None, probables)
 
-            for k, v in o.items():
-                if not k:
+    names = out["player_names"]
+    active = out["active_pitchers"]
+    for team_group in ((summary_obj.get("boxscore") or {}).get("players") or []):
+        if not isinstance(team_group, dict):
+            continue
+        team_id = (team_group.get("team") or {}).get("id")
+        for stat_group in team_group.get("statistics") or []:
+            if not isinstance(stat_group, dict):
+                continue
+            want_pitcher = team_id is not None and str(stat_group.get("type") or "").lower() == "pitching"
+            for row in stat_group.get("athletes") or []:
+                if not isinstance(row, dict):
                     continue
-                key = str(k).lower()
-                if key in ("probablepitcher", "probable", "probables", "probablepitchers", "projectedpitcher"):
-                    # v can be a dict or list
-                    if isinstance(v, dict):
-                        side = (v.get("homeAway") or v.get("homeaway") or next_side_ctx)
-                        athlete = v.get("athlete") or v.get("player") or v
-                        parsed = _extract_probable_name_id(athlete, v.get("playerId"))
-                        if side == "home" and not out["home"] and parsed:
-                            out["home"] = parsed
-                        if side == "away" and not out["away"] and parsed:
-                            out["away"] = parsed
-
-                    elif isinstance(v, list):
-                        for item in v:
-                            if not isinstance(item, dict):
-                                continue
-                            side = item.get("homeAway") or item.get("homeaway") or next_side_ctx
-                            athlete = item.get("athlete") or item.get("player") or item
-                            parsed = _extract_probable_name_id(athlete, item.get("playerId"))
-
-                            if side == "home" and not out["home"] and parsed:
-                                out["home"] = parsed
-                            if side == "away" and not out["away"] and parsed:
-                                out["away"] = parsed
-
-                # continue searching deeper
-                _recurse(v, next_side_ctx)
-        elif isinstance(o, list):
-            for i in o:
-                _recurse(i, side_ctx)
+                athlete = row.get("athlete") or {}
+                if not isinstance(athlete, dict):
+                    continue
+                pid = athlete.get("id")
+                name = athlete.get("displayName") or athlete.get("fullName") or athlete.get("shortName")
+                if pid and name:
+                    names[str(pid)] = str(name)
+                if want_pitcher and name and row.get("active"):
+                    active[str(team_id)] = {"id": pid, "name": name}
+                    want_pitcher = False
 
-    _recurse(obj)
+    if not (probables["home"] and probables["away"]):
+        _walk_probables(summary_obj, probables)
     return out
 
 
-def _fetch_summary_for_event(event_id: str, timeout: int = 12) -> Optional[Dict[str, Any]]:
-    """Best-effort fetch of extra event details.
+def _infer_pitcher(extracted: Dict[str, Any], inning_half: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Current pitcher from the boxscore's active pitchers: the defending team's, or the only one found."""
+    if not (extracted["header_comp"].get("competitors") or []):
+        return None
+    active = extracted["active_pitchers"]
+    ih = str(inning_half or "").lower()
+    defense_team_id = None
+    if ih == "top":
+        defense_team_id = extracted["home_team_id"]
+    elif ih == "bottom":
+        defense_team_id = extracted["away_team_id"]
+
+    if defense_team_id and defense_team_id in active:
+        return active[defense_team_id]
+
+    # Fallback: if we only found one active pitcher, use it.
+    if len(active) == 1:
+        return next(iter(active.values()))
+    return None
+
+
+def _situation_fingerprint(sit: Any, status_detail: Any) -> tuple:
+    sit = sit if isinstance(sit, dict) else {}
+    last_play = sit.get("lastPlay") or {}
+    return (
+        sit.get("inning"),
+        sit.get("isTopInning"),
+        sit.get("halfInning"),
+        sit.get("outs"),
+        sit.get("balls"),
+        sit.get("strikes"),
+        bool(sit.get("onFirst")),
+        bool(sit.get("onSecond")),
+        bool(sit.get("onThird")),
+        last_play.get("id") if isinstance(last_play, dict) else None,
+        str(status_detail or ""),
+    )
+
+
+def _live_memory_get(event_id: str, fingerprint: tuple) -> Optional[Dict[str, Any]]:
+    with _live_memory_lock:
+        mem = _live_memory.get(event_id)
+    if mem and mem["fingerprint"] == fingerprint and time.time() - mem["at"] < LIVE_MEMORY_MAX_AGE_SECONDS:
+        return mem["enrichment"]
+    return None
+
 
-    Returns parsed summary data containing optional probable and live fields.
+def _live_memory_put(event_id: str, fingerprint: tuple, enrichment: Dict[str, Any]):
+    with _live_memory_lock:
+        _live_memory.pop(event_id, None)
+        _live_memory[event_id] = {"fingerprint": fingerprint, "enrichment": enrichment, "at": time.time()}
+        while len(_live_memory) > LIVE_MEMORY_MAX_ENTRIES:
+            del _live_memory[next(iter(_live_memory))]
+
+
+def _apply_summary(cur: Dict[str, Any], fb: Dict[str, Any]) -> None:
+    """Fill a game's missing probables/decisions/live people from an extracted summary result."""
+    # Only set values if they were missing originally
+    fb_prob = fb.get("probables") or {}
+    if not cur.get("home_probable") and fb_prob.get("home"):
+        cur["home_probable"] = fb_prob.get("home")
+    if not cur.get("away_probable") and fb_prob.get("away"):
+        cur["away_probable"] = fb_prob.get("away")
+    if cur.get("state") == "post" and not cur.get("decisions") and fb.get("decisions"):
+        cur["decisions"] = fb.get("decisions")
+    if cur.get("state") != "in":
+        return
+
+    cur_live = cur.get("live") or {}
+    fb_live = fb.get("live") or {}
+    is_between_innings = any(
+        x in str(cur.get("status") or "").lower() for x in ("middle", "end")
+    )
+
+    if not cur_live or not _has_live_essentials(cur_live):
+        cur["live"] = fb_live
+        return
+
+    # Keep live inning/count/bases from scoreboard, but fill missing people fields.
+    merged_live = dict(cur_live)
+    changed = False
+
+    if (not (cur_live.get("batter") or {}).get("name")) and (fb_live.get("batter") or {}).get("name"):
+        merged_live["batter"] = fb_live.get("batter")
+        changed = True
+
+    if (not (cur_live.get("pitcher") or {}).get("name")) and (fb_live.get("pitcher") or {}).get("name"):
+        merged_live["pitcher"] = fb_live.get("pitcher")
+        changed = True
+
+    cur_due = cur_live.get("due_up") or []
+    fb_due = fb_live.get("due_up") or []
+    cur_due_has_names = any(isinstance(p, dict) and p.get("name") for p in cur_due)
+    fb_due_has_names = any(isinstance(p, dict) and p.get("name") for p in fb_due)
+    if ((not cur_due_has_names) and fb_due_has_names) or (is_between_innings and fb_due_has_names):
+        merged_live["due_up"] = fb_due
+        changed = True
+
+    if changed:
+        cur["live"] = merged_live
+
+
+def _summary_ttl(state: Optional[str], result: Optional[Dict[str, Any]]) -> int:
+    if result is None:
+        return SUMMARY_TTL_EMPTY
+    if state == "post":
+        return SUMMARY_TTL_POST if result.get("decisions") else SUMMARY_TTL_EMPTY
+    if state == "in":
+        return SUMMARY_TTL_IN
+    return SUMMARY_TTL_PRE
+
+
+def _prune_summary_cache(now: float):
+    # caller holds _summary_cache_lock
+    if len(_summary_cache) <= SUMMARY_CACHE_MAX_ENTRIES:
+        return
+    for key in [k for k, v in _summary_cache.items() if v["expires_at"] <= now]:
+        del _summary_cache[key]
+    while len(_summary_cache) > SUMMARY_CACHE_MAX_ENTRIES:
+        del _summary_cache[next(iter(_summary_cache))]
+
+
+def _summary_future(event_id: str, timeout: int = 12, state: Optional[str] = None, fingerprint: Optional[tuple] = None) -> Future:
     """
-    try:
-        r = requests.get(SUMMARY_URL, params={"event": event_id}, timeout=timeout, headers=REQUEST_HEADERS)
-        r.raise_for_status()
-        j = r.json()
-        player_name_by_id = _player_name_map_from_summary(j)
-        found_probables = _find_probables_in_obj(j)
-        found_live = _live_from_situation(j.get("situation"), player_name_by_id=player_name_by_id)
-        header_comp = ((j.get("header") or {}).get("competitions") or [{}])[0]
-        found_decisions = _extract_decisions_from_status((header_comp or {}).get("status") or {})
-
-        # ESPN occasionally omits situation.pitcher mid-inning; infer from active pitching boxscore.
-        if found_live is not None and not (found_live.get("pitcher") or {}).get("name"):
-            status_detail = ((header_comp or {}).get("status") or {}).get("type", {}).get("detail")
-            inning_half = found_live.get("inning_half") or _inning_half_from_text(status_detail)
-            inferred_pitcher = _infer_pitcher_from_summary(j, inning_half)
-            if inferred_pitcher:
-                found_live["pitcher"] = inferred_pitcher
-
-        if found_probables.get("home") or found_probables.get("away") or _has_live_essentials(found_live) or found_decisions:
-            return {
-                "probables": found_probables,
-                "live": found_live,
-                "decisions": found_decisions,
-            }
-    except Exception:
-        return None
+    Future for the extracted summary of one event ({"probables", "live", "decisions"}
+    or None), cached with a state-dependent TTL; the result is shared with the cache,
+    so treat it as read-only. Cache hits come back already resolved; otherwise callers
+    asking for the same (event, state, fingerprint) share one queued lookup on the
+    process-wide pool. Live games pass their situation fingerprint so a changed
+    situation always misses.
+    """
+    key = (str(event_id), state, fingerprint)
+    with _summary_cache_lock:
+        hit = _summary_cache.get(key)
+    if hit and hit["expires_at"] > time.time():
+        done: Future = Future()
+        done.set_result(hit["result"])
+        return done
+
+    def load():
+        try:
+            result = _load_summary_for_event(event_id, timeout)
+        except Exception:
+            return None  # not cached: the next poll retries
+        now = time.time()
+        with _summary_cache_lock:
+            _summary_cache.pop(key, None)
+            _summary_cache[key] = {"result": result, "expires_at": now + _summary_ttl(state, result)}
+            _prune_summary_cache(now)
+        return result
+
+    def forget(f: Future):
+        with _summary_pending_lock:
+            if _summary_pending.get(key) is f:
+                del _summary_pending[key]
+
+    with _summary_pending_lock:
+        fut = _summary_pending.get(key)
+        created = fut is None
+        if created:
+            fut = _summary_pending[key] = _summary_pool.submit(load)
+    if created:
+        # outside the lock: the callback runs inline if the lookup has already finished
+        fut.add_done_callback(forget)
+    return fut
+
+
+def _load_summary_for_event(event_id: str, timeout: int) -> Optional[Dict[str, Any]]:
+    """Extracted summary fields, or None when the summary has nothing useful. Raises on fetch errors."""
+    r = upstream.get(SUMMARY_URL, params={"event": event_id}, timeout=timeout, headers=REQUEST_HEADERS)
+    r.raise_for_status()
+    return _summary_result(codec.response_json(r))
+
+
+def _summary_result(j: Any) -> Optional[Dict[str, Any]]:
+    """{"probables", "live", "decisions"} extracted from a summary body, or None when it has nothing useful."""
+    extracted = _extract_summary(j)
+    found_probables = extracted["probables"]
+    found_live = _live_from_situation(j.get("situation"), player_name_by_id=extracted["player_names"])
+    header_comp = extracted["header_comp"]
+    found_decisions = _extract_decisions_from_status(header_comp.get("status") or {})
+
+    # ESPN occasionally omits situation.pitcher mid-inning; infer from active pitching boxscore.
+    if found_live is not None and not (found_live.get("pitcher") or {}).get("name"):
+        status_detail = (header_comp.get("status") or {}).get("type", {}).get("detail")
+        inning_half = found_live.get("inning_half") or _inning_half_from_text(status_detail)
+        inferred_pitcher = _infer_pitcher(extracted, inning_half)
+        if inferred_pitcher:
+            found_live["pitcher"] = inferred_pitcher
+
+    if found_probables.get("home") or found_probables.get("away") or _has_live_essentials(found_live) or found_decisions:
+        return {
+            "probables": found_probables,
+            "live": found_live,
+            "decisions": found_decisions,
+        }
     return None
 
 def get_mlb_games(date_yyyymmdd: str, timeout: int = 12, use_summary_fallback: bool = True) -> List[Dict[str, Any]]:
@@ -409,18 +582,19 @@ def get_mlb_games(date_yyyymmdd: str, timeout: int = 12, use_summary_fallback: b
     date_yyyymmdd: '20260113'
     Returns a list of games with teams + status + (final/live) scores when present.
     """
-    r = requests.get(
+    r = upstream.get(
         SCOREBOARD_URL,
         params={"dates": date_yyyymmdd},
         timeout=timeout,
         headers=REQUEST_HEADERS,
     )
     r.raise_for_status()
-    data = r.json()
+    data = codec.response_json(r)
 
     out: List[Dict[str, Any]] = []
     # First pass: parse scoreboard JSON and collect events needing summary fallback
     need_summary: Dict[int, str] = {}
+    fingerprints: Dict[int, tuple] = {}   # out index -> situation fingerprint (live games)
     for ev_idx, ev in enumerate(data.get("events", []) or []):
         event_id = ev.get("id")
         competitions = ev.get("competitions") or []
@@ -440,6 +614,8 @@ def get_mlb_games(date_yyyymmdd: str, timeout: int = 12, use_summary_fallback: b
         home_probable = None
         away_probable = None
         live = _live_from_situation(comp.get("situation")) if state == "in" else None
+        if state == "in":
+            fingerprints[len(out)] = _situation_fingerprint(comp.get("situation"), detail)
         competitors = comp.get("competitors", []) or []
         for c in competitors:
             side = c.get("homeAway")
@@ -533,73 +709,33 @@ def get_mlb_games(date_yyyymmdd: str, timeout: int = 12, use_summary_fallback: b
             "decisions": decisions,
         })
 
-    # If we need to enrich some events with summary lookups, do that in parallel
+    # If we need to enrich some events with summary lookups, do that on the shared pool,
+    # waiting at most MLB_SUMMARY_DEADLINE_SECONDS; stragglers are skipped for this response.
+    # Live games whose situation has not moved since the last enrichment reuse it instead.
     if use_summary_fallback and need_summary:
         try:
-            from concurrent.futures import ThreadPoolExecutor, as_completed
+            futures = {}
+            for idx, eid in need_summary.items():
+                fp = fingerprints.get(idx)
+                if fp is not None:
+                    remembered = _live_memory_get(eid, fp)
+                    if remembered is not None:
+                        _apply_summary(out[idx], remembered)
+                        continue
+                futures[_summary_future(eid, timeout=timeout, state=out[idx].get("state"), fingerprint=fp)] = idx
 
-            def _fetch_wrap(idx, eid):
+            finished, _ = wait(futures, timeout=MLB_SUMMARY_DEADLINE_SECONDS) if futures else (set(), set())
+            for f in finished:
+                idx = futures[f]
                 try:
-                    return idx, _fetch_summary_for_event(eid, timeout=timeout)
+                    fb = f.result()
                 except Exception:
-                    return idx, None
-
-            max_workers = min(8, max(2, len(need_summary)))
-            with ThreadPoolExecutor(max_workers=max_workers) as ex:
-                futures = [ex.submit(_fetch_wrap, idx, eid) for idx, eid in need_summary.items()]
-                for f in as_completed(futures):
-                    try:
-                        idx, fb = f.result()
-                    except Exception:
-                        continue
-                    if not fb:
-                        continue
-                    # Only set values if they were missing originally
-                    cur = out[idx]
-                    fb_prob = fb.get("probables") or {}
-                    if not cur.get("home_probable") and fb_prob.get("home"):
-                        cur["home_probable"] = fb_prob.get("home")
-                    if not cur.get("away_probable") and fb_prob.get("away"):
-                        cur["away_probable"] = fb_prob.get("away")
-                    if cur.get("state") == "post" and not cur.get("decisions") and fb.get("decisions"):
-                        cur["decisions"] = fb.get("decisions")
-                    if cur.get("state") == "in":
-                        cur_live = cur.get("live") or {}
-                        fb_live = fb.get("live") or {}
-                        is_between_innings = any(
-                            x in str(cur.get("status") or "").lower() for x in ("middle", "end")
-                        )
-
-                        if not cur_live:
-                            cur["live"] = fb_live
-                            continue
-
-                        if not _has_live_essentials(cur_live):
-                            cur["live"] = fb_live
-                            continue
-
-                        # Keep live inning/count/bases from scoreboard, but fill missing people fields.
-                        merged_live = dict(cur_live)
-                        changed = False
-
-                        if (not (cur_live.get("batter") or {}).get("name")) and (fb_live.get("batter") or {}).get("name"):
-                            merged_live["batter"] = fb_live.get("batter")
-                            changed = True
-
-                        if (not (cur_live.get("pitcher") or {}).get("name")) and (fb_live.get("pitcher") or {}).get("name"):
-                            merged_live["pitcher"] = fb_live.get("pitcher")
-                            changed = True
-
-                        cur_due = cur_live.get("due_up") or []
-                        fb_due = fb_live.get("due_up") or []
-                        cur_due_has_names = any(isinstance(p, dict) and p.get("name") for p in cur_due)
-                        fb_due_has_names = any(isinstance(p, dict) and p.get("name") for p in fb_due)
-                        if ((not cur_due_has_names) and fb_due_has_names) or (is_between_innings and fb_due_has_names):
-                            merged_live["due_up"] = fb_due
-                            changed = True
-
-                        if changed:
-                            cur["live"] = merged_live
+                    continue
+                if not fb:
+                    continue
+                if idx in fingerprints:
+                    _live_memory_put(need_summary[idx], fingerprints[idx], fb)
+                _apply_summary(out[idx], fb)
         except Exception:
             # Non-fatal: continue with whatever we have
             pass
@@ -612,4 +748,62 @@ def get_mlb_games(date_yyyymmdd: str, timeout: int = 12, use_summary_fallback: b
             if not cur.get("away_probable"):
                 cur["away_probable"] = {"id": None, "name": "TBA"}
 
+    _remember_games(date_yyyymmdd, out)
     return out
+
+
+def _remember_games(date_yyyymmdd: str, games: List[Dict[str, Any]]):
+    with _event_dates_lock:
+        for g in games:
+            if g.get("id") is None:
+                continue
+            eid = str(g["id"])
+            _event_dates.pop(eid, None)
+            _event_dates[eid] = date_yyyymmdd
+        while len(_event_dates) > EVENT_DATES_MAX_ENTRIES:
+            del _event_dates[next(iter(_event_dates))]
+
+
+def event_date(event_id: str) -> Optional[str]:
+    """Slate date (YYYYMMDD) an event was last built for, if it has been seen."""
+    with _event_dates_lock:
+        return _event_dates.get(str(event_id))
+
+
+def live_view(game: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The per-game live block: state/status, scores and the live situation (count, bases,
+    batter, pitcher, due-up). Returns the previous view object while none of that changed.
+    """
+    def side(team: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        if not team:
+            return None
+        return {"id": team.get("id"), "abbr": team.get("abbr"), "score": team.get("score")}
+
+    home, away = game.get("home") or {}, game.get("away") or {}
+    fp = (
+        game.get("state"), game.get("status"),
+        home.get("id"), home.get("abbr"), home.get("score"),
+        away.get("id"), away.get("abbr"), away.get("score"),
+        codec.dumps(game.get("live"), sort_keys=True),
+    )
+    eid = str(game.get("id"))
+    with _live_views_lock:
+        hit = _live_views.get(eid)
+    if hit and hit[0] == fp:
+        return hit[1]
+
+    view = {
+        "id": game.get("id"),
+        "state": game.get("state"),
+        "status": game.get("status"),
+        "home": side(game.get("home")),
+        "away": side(game.get("away")),
+        "live": game.get("live"),
+    }
+    with _live_views_lock:
+        _live_views.pop(eid, None)
+        _live_views[eid] = (fp, view)
+        while len(_live_views) > EVENT_DATES_MAX_ENTRIES:
+            del _live_views[next(iter(_live_views))]
+    return view
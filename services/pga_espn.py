@@ -1,13 +1,36 @@
 from __future__ import annotations
 
+import threading
+import time
 from typing import Any, Dict, List, Optional
 
-import requests
 from fastapi import HTTPException
 
+from services import singleflight, upstream
+from utils import codec
+
 PGA_SCOREBOARD_URL = "https://site.api.espn.com/apis/site/v2/sports/golf/pga/scoreboard"
 REQUEST_HEADERS = {"User-Agent": "sports-slate/1.0"}
 
+# Built leaderboards per requested date ("current" for the live event). Scores only
+# move while a round is in progress; a finished event is final.
+LEADERBOARD_TTL_IN = 30
+LEADERBOARD_TTL_PRE = 300
+LEADERBOARD_TTL_POST = 60 * 60
+LEADERBOARD_CACHE_MAX_ENTRIES = 32
+
+# date key -> {"result", "expires_at"}
+_leaderboard_cache: Dict[str, Dict[str, Any]] = {}
+_leaderboard_cache_lock = threading.Lock()
+
+# Per-event state from the last build, so a refresh only re-normalizes competitors whose
+# score/rounds/holes changed and can report position movement against the prior snapshot.
+# event_id -> {"rows": {player_id: (fingerprint, row, sort_key)},
+#              "positions": {player_id: position}, "baseline": positions before the last movement}
+_event_snapshots: Dict[str, Dict[str, Any]] = {}
+_event_snapshots_lock = threading.Lock()
+EVENT_SNAPSHOTS_MAX_ENTRIES = 16
+
 
 def _score_to_int(score: Any) -> Optional[int]:
     if score is None:
@@ -105,88 +128,169 @@ def _tee_time_sort_key(tee_time: Optional[str]) -> int:
     return 999999
 
 
-def _normalize_leaderboard_rows(competitors: List[Dict[str, Any]], default_tee_time: Optional[str] = None) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    for comp in competitors:
-        athlete = comp.get("athlete") or {}
-        score_raw = comp.get("score")
-        score_num = _score_to_int(score_raw)
-        round_strokes = {}
-        round_to_par = {}
-        linescores = comp.get("linescores") or []
-        for rs in linescores:
-            if not isinstance(rs, dict):
-                continue
-            round_num = rs.get("period")
-            if round_num is None:
-                continue
-            try:
-                round_num = int(round_num)
-            except Exception:
-                continue
-
-            stroke_value = rs.get("value")
-            if stroke_value is not None:
-                round_strokes[round_num] = int(stroke_value) if isinstance(stroke_value, (int, float)) and float(stroke_value).is_integer() else stroke_value
-
-            to_par_value = rs.get("displayValue")
-            if to_par_value is not None:
-                round_to_par[round_num] = str(to_par_value)
-
-        tee_time = _parse_tee_time_from_competitor(comp) or default_tee_time
-        row = {
-            "order": comp.get("order"),
-            "player": {
-                "id": athlete.get("id"),
-                "name": athlete.get("displayName") or athlete.get("fullName") or athlete.get("shortName") or "Unknown",
-                "short_name": athlete.get("shortName"),
-                "country": ((athlete.get("flag") or {}).get("alt")),
-                "country_flag": ((athlete.get("flag") or {}).get("href")),
-            },
-            "score": {
-                "raw": score_raw,
-                "display": _score_display(score_raw),
-                "to_par": score_num,
-            },
-            "holes_completed": _holes_completed(comp),
-            "round_strokes": round_strokes,
-            "round_to_par": round_to_par,
-            "tee_time": tee_time,
-        }
-        row["not_started"] = (row["holes_completed"] == 0)
-        rows.append(row)
-
-    # Sort: started by score, not-started by tee time (soonest first)
-    def sort_key(r):
-        is_not_started = r.get("not_started", False)
-        if is_not_started:
-            # Not-started: sort by tee time (earliest first), then by name
-            return (True, _tee_time_sort_key(r.get("tee_time")), r["player"].get("name") or "")
-        else:
-            # Started: sort by score, then by name
-            return (False, r["score"]["to_par"] if r["score"]["to_par"] is not None else 999, r["player"].get("name") or "")
-    
-    rows.sort(key=sort_key)
+def _normalize_competitor(comp: Dict[str, Any], default_tee_time: Optional[str] = None) -> Dict[str, Any]:
+    athlete = comp.get("athlete") or {}
+    score_raw = comp.get("score")
+    score_num = _score_to_int(score_raw)
+    round_strokes = {}
+    round_to_par = {}
+    linescores = comp.get("linescores") or []
+    for rs in linescores:
+        if not isinstance(rs, dict):
+            continue
+        round_num = rs.get("period")
+        if round_num is None:
+            continue
+        try:
+            round_num = int(round_num)
+        except Exception:
+            continue
 
+        stroke_value = rs.get("value")
+        if stroke_value is not None:
+            round_strokes[round_num] = int(stroke_value) if isinstance(stroke_value, (int, float)) and float(stroke_value).is_integer() else stroke_value
+
+        to_par_value = rs.get("displayValue")
+        if to_par_value is not None:
+            round_to_par[round_num] = str(to_par_value)
+
+    tee_time = _parse_tee_time_from_competitor(comp) or default_tee_time
+    row = {
+        "order": comp.get("order"),
+        "player": {
+            "id": athlete.get("id"),
+            "name": athlete.get("displayName") or athlete.get("fullName") or athlete.get("shortName") or "Unknown",
+            "short_name": athlete.get("shortName"),
+            "country": ((athlete.get("flag") or {}).get("alt")),
+            "country_flag": ((athlete.get("flag") or {}).get("href")),
+        },
+        "score": {
+            "raw": score_raw,
+            "display": _score_display(score_raw),
+            "to_par": score_num,
+        },
+        "holes_completed": _holes_completed(comp),
+        "round_strokes": round_strokes,
+        "round_to_par": round_to_par,
+        "tee_time": tee_time,
+    }
+    row["not_started"] = (row["holes_completed"] == 0)
+    return row
+
+
+def _row_sort_key(row: Dict[str, Any]) -> tuple:
+    # Started by score, not-started by tee time (soonest first); name breaks ties.
+    name = row["player"].get("name") or ""
+    if row.get("not_started"):
+        return (True, _tee_time_sort_key(row.get("tee_time")), name)
+    to_par = row["score"]["to_par"]
+    return (False, to_par if to_par is not None else 999, name)
+
+
+def _competitor_fingerprint(comp: Dict[str, Any], default_tee_time: Optional[str]) -> tuple:
+    """Everything a normalized row is derived from that moves during an event."""
+    rounds = []
+    for ls in comp.get("linescores") or []:
+        if isinstance(ls, dict):
+            holes = ls.get("linescores")
+            rounds.append((ls.get("period"), ls.get("value"), ls.get("displayValue"), len(holes) if isinstance(holes, list) else None))
+    # Tee times are posted into existing round entries (statistics) without touching the scores.
+    tee_time = _parse_tee_time_from_competitor(comp) or default_tee_time
+    return (comp.get("score"), tee_time, tuple(rounds))
+
+
+def _rank_rows(keyed: List[tuple]) -> List[Dict[str, Any]]:
+    """Sort (sort_key, row) pairs once and assign tied positions; rows must be safe to mutate."""
+    keyed.sort(key=lambda kr: kr[0])
+
+    rows = []
     rank = 0
     prev_score = object()
-    for idx, row in enumerate(rows, start=1):
+    for idx, (_, row) in enumerate(keyed, start=1):
         cur = row["score"]["to_par"]
         if cur != prev_score:
             rank = idx
             prev_score = cur
         row["position"] = rank if not row.get("not_started") else None
-
+        rows.append(row)
     return rows
 
 
-def get_pga_leaderboard(date_yyyymmdd: Optional[str] = None, limit: int = 50, timeout: int = 15) -> Dict[str, Any]:
+def _normalize_leaderboard_rows(competitors: List[Dict[str, Any]], default_tee_time: Optional[str] = None) -> List[Dict[str, Any]]:
+    keyed = []
+    for comp in competitors:
+        row = _normalize_competitor(comp, default_tee_time)
+        keyed.append((_row_sort_key(row), row))
+    return _rank_rows(keyed)
+
+
+def _incremental_leaderboard_rows(
+    event_id: Optional[str],
+    competitors: List[Dict[str, Any]],
+    default_tee_time: Optional[str] = None,
+) -> tuple[List[Dict[str, Any]], int]:
+    """
+    Like _normalize_leaderboard_rows, but reuses the previous build's row for every
+    competitor whose fingerprint is unchanged, and sets position_change (positions
+    gained since the prior snapshot; None when either position is unknown). A refresh
+    where nobody moved keeps the previous baseline, so movement stays visible until
+    the board changes again.
+    Returns (rows, number of competitors re-normalized).
+    """
+    with _event_snapshots_lock:
+        prev = _event_snapshots.get(str(event_id)) if event_id is not None else None
+    prev_rows = prev["rows"] if prev else {}
+
+    entries: Dict[Any, tuple] = {}
+    keyed = []
+    normalized = 0
+    for comp in competitors:
+        pid = (comp.get("athlete") or {}).get("id") or comp.get("id")
+        fp = _competitor_fingerprint(comp, default_tee_time)
+        hit = prev_rows.get(pid) if pid is not None else None
+        if hit is not None and hit[0] == fp:
+            _, base, key = hit
+        else:
+            base = _normalize_competitor(comp, default_tee_time)
+            key = _row_sort_key(base)
+            normalized += 1
+        if pid is not None:
+            entries[pid] = (fp, base, key)
+        # Copy: the cached base rows are shared with earlier (possibly still served) results.
+        row = dict(base)
+        row["order"] = comp.get("order")
+        keyed.append((key, row))
+
+    rows = _rank_rows(keyed)
+
+    positions = {row["player"].get("id"): row["position"] for row in rows if row["player"].get("id") is not None}
+    if prev is None:
+        baseline = {}
+    elif positions == prev["positions"]:
+        baseline = prev["baseline"]
+    else:
+        baseline = prev["positions"]
+    for row in rows:
+        before = baseline.get(row["player"].get("id"))
+        now = row["position"]
+        row["position_change"] = (before - now) if before is not None and now is not None else None
+
+    if event_id is not None:
+        with _event_snapshots_lock:
+            _event_snapshots.pop(str(event_id), None)
+            _event_snapshots[str(event_id)] = {"rows": entries, "positions": positions, "baseline": baseline}
+            while len(_event_snapshots) > EVENT_SNAPSHOTS_MAX_ENTRIES:
+                del _event_snapshots[next(iter(_event_snapshots))]
+    return rows, normalized
+
+
+def _fetch_scoreboard(date_yyyymmdd: Optional[str], timeout: int) -> Dict[str, Any]:
     params: Dict[str, Any] = {}
     if date_yyyymmdd:
         params["dates"] = date_yyyymmdd
 
     try:
-        response = requests.get(PGA_SCOREBOARD_URL, params=params, timeout=timeout, headers=REQUEST_HEADERS)
+        response = upstream.get(PGA_SCOREBOARD_URL, params=params, timeout=timeout, headers=REQUEST_HEADERS)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"ESPN request failed: {type(e).__name__}: {e}")
 
@@ -201,7 +305,67 @@ def get_pga_leaderboard(date_yyyymmdd: Optional[str] = None, limit: int = 50, ti
             },
         )
 
-    data = response.json()
+    return codec.response_json(response)
+
+
+# limit -> (source result, sliced result); repeat reads of one snapshot return the same object
+_limit_memo: Dict[int, tuple] = {}
+_limit_memo_lock = threading.Lock()
+
+
+def limit_leaderboard(result: Dict[str, Any], limit: int) -> Dict[str, Any]:
+    """Slice a full-field leaderboard result down to `limit` rows (0 = no limit) without mutating it."""
+    rows = result.get("leaderboard") or []
+    if limit <= 0 or len(rows) <= limit:
+        return result
+    with _limit_memo_lock:
+        memo = _limit_memo.get(limit)
+    if memo and memo[0] is result:
+        return memo[1]
+    out = dict(result)
+    out["leaderboard"] = rows[:limit]
+    out["count"] = limit
+    with _limit_memo_lock:
+        if len(_limit_memo) > 16:
+            _limit_memo.clear()
+        _limit_memo[limit] = (result, out)
+    return out
+
+
+def _leaderboard_ttl(result: Dict[str, Any]) -> int:
+    state = (((result.get("event") or {}).get("status")) or {}).get("state")
+    if state == "in":
+        return LEADERBOARD_TTL_IN
+    if state == "post":
+        return LEADERBOARD_TTL_POST
+    return LEADERBOARD_TTL_PRE
+
+
+def get_pga_leaderboard(date_yyyymmdd: Optional[str] = None, limit: int = 50, timeout: int = 15) -> Dict[str, Any]:
+    """
+    Leaderboard for the event on `date_yyyymmdd` (None = current event), full field
+    built once per TTL (by round state) and sliced to `limit` (0 = no limit) per call.
+    """
+    key = date_yyyymmdd or "current"
+    now = time.time()
+    with _leaderboard_cache_lock:
+        hit = _leaderboard_cache.get(key)
+    if hit and hit["expires_at"] > now:
+        return limit_leaderboard(hit["result"], limit)
+
+    result = singleflight.do(f"pga:leaderboard:{key}", lambda: _build_leaderboard(date_yyyymmdd, timeout))
+
+    now = time.time()
+    with _leaderboard_cache_lock:
+        _leaderboard_cache.pop(key, None)
+        _leaderboard_cache[key] = {"result": result, "expires_at": now + _leaderboard_ttl(result)}
+        while len(_leaderboard_cache) > LEADERBOARD_CACHE_MAX_ENTRIES:
+            del _leaderboard_cache[next(iter(_leaderboard_cache))]
+    return limit_leaderboard(result, limit)
+
+
+def _build_leaderboard(date_yyyymmdd: Optional[str], timeout: int) -> Dict[str, Any]:
+    data = _fetch_scoreboard(date_yyyymmdd, timeout)
     events = data.get("events") or []
     if not events:
         return {
@@ -218,12 +382,9 @@ def get_pga_leaderboard(date_yyyymmdd: Optional[str] = None, limit: int = 50, ti
 
     competitors = competition.get("competitors") or []
     competition_time = competition.get("date") or event.get("date")
-    leaderboard = _normalize_leaderboard_rows(competitors, competition_time)
+    leaderboard, _ = _incremental_leaderboard_rows(event.get("id"), competitors, competition_time)
     total_count = len(leaderboard)
 
-    if limit > 0:
-        leaderboard = leaderboard[:limit]
-    
     # Detect tournament timezone from event name or default to EDT (most PGA tournaments are in EDT)
     event_name = (event.get("name") or "").upper()
     tournament_tz = "EDT"  # Default to EDT
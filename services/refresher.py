@@ -0,0 +1,263 @@
+# services/refresher.py
+"""
+Background refresher for today's CBB, MLB and PGA slates.
+
+One daemon thread per slate rebuilds the slate on a schedule driven by the
+games themselves (status_state / start_utc): every few seconds while anything
+is live, slowly before the first start, and not at all once everything is
+final. Request handlers read the latest snapshot via snapshot(), so the number
+of viewers no longer drives upstream traffic.
+"""
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+from services import singleflight
+from utils.dates import kp_date, today_yyyymmdd_eastern
+
+REFRESH_LIVE_SECONDS = 5           # any game in progress
+REFRESH_PREGAME_SECONDS = 30       # inside the lead window before the first start
+REFRESH_IDLE_SECONDS = 300         # first start is still far away (or empty slate)
+REFRESH_ERROR_SECONDS = 30         # retry delay after a failed build
+PREGAME_LEAD_SECONDS = 15 * 60
+SNAPSHOT_GRACE_SECONDS = 30        # how long past its next refresh a snapshot is still served
+
+# (slate, date) -> {"payload", "built_at", "next_at", "fresh_until", "last_error"}
+_snapshots: dict[tuple[str, str], dict] = {}
+_snapshots_lock = threading.Lock()
+
+# Reads the refresher is not keeping fresh (other dates, refresher off, snapshot past its
+# grace) build on demand. Concurrent readers of one slate share that build and reuse it for
+# READ_THROUGH_SECONDS, so SSE connections and live polls don't each go upstream.
+READ_THROUGH_SECONDS = REFRESH_LIVE_SECONDS
+READ_THROUGH_MAX_ENTRIES = 32
+# (slate, *args) -> {"payload", "at"}
+_read_through: dict[tuple, dict] = {}
+_read_through_lock = threading.Lock()
+
+_stop = threading.Event()
+_threads: list[threading.Thread] = []
+
+
+def _parse_iso(value: Any) -> Optional[float]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except Exception:
+        return None
+
+
+def next_interval(states: Iterable[tuple[Optional[str], Any]], now: Optional[float] = None) -> Optional[float]:
+    """
+    states: (status_state, start_utc) per game.
+    Returns seconds until the next refresh, or None when every game is final.
+    """
+    now = time.time() if now is None else now
+    states = list(states)
+    if not states:
+        return REFRESH_IDLE_SECONDS
+    if any(st == "in" for st, _ in states):
+        return REFRESH_LIVE_SECONDS
+    pending = [start for st, start in states if st != "post"]
+    if not pending:
+        return None
+
+    starts = [t for t in (_parse_iso(s) for s in pending) if t is not None]
+    if not starts:
+        return REFRESH_IDLE_SECONDS
+    until_lead = min(starts) - PREGAME_LEAD_SECONDS - now
+    if until_lead <= 0:
+        return REFRESH_PREGAME_SECONDS
+    return max(REFRESH_PREGAME_SECONDS, min(REFRESH_IDLE_SECONDS, until_lead))
+
+
+# ----------------------------
+# Slates
+# ----------------------------
+def _build_cbb(date: str) -> dict:
+    from services.build import build_games_for_date
+    return build_games_for_date(date, date, "cbb")
+
+
+def _states_cbb(payload: dict) -> list:
+    return [(g.get("status_state"), g.get("start_utc")) for g in payload.get("games") or []]
+
+
+def _build_mlb(date: str) -> list:
+    from services.mlb_espn import get_mlb_games
+    return get_mlb_games(date)
+
+
+def _states_mlb(payload: list) -> list:
+    return [(g.get("state"), g.get("startTime")) for g in payload or []]
+
+
+def _build_pga(date: str) -> dict:
+    from services.pga_espn import get_pga_leaderboard
+    # The UI asks for the current event (no date); keep the full field and slice per request.
+    return get_pga_leaderboard(date_yyyymmdd=None, limit=0)
+
+
+def _states_pga(payload: dict) -> list:
+    event = payload.get("event") or {}
+    if not event:
+        return []
+    return [((event.get("status") or {}).get("state"), event.get("start_date"))]
+
+
+SLATES: dict[str, tuple[Callable[[str], Any], Callable[[Any], list]]] = {
+    "cbb": (_build_cbb, _states_cbb),
+    "mlb": (_build_mlb, _states_mlb),
+    "pga": (_build_pga, _states_pga),
+}
+
+
+# ----------------------------
+# Snapshot store
+# ----------------------------
+def snapshot(slate: str, date: str) -> Any:
+    """Latest payload for (slate, date) if the refresher is keeping it fresh, else None."""
+    with _snapshots_lock:
+        snap = _snapshots.get((slate, date))
+    if not snap or snap.get("built_at") is None:
+        return None
+    fresh_until = snap.get("fresh_until")
+    if fresh_until is not None and fresh_until < time.time():
+        return None
+    return snap["payload"]
+
+
+def _read_through_build(key: tuple, build: Callable[[], Any]) -> Any:
+    now = time.time()
+    with _read_through_lock:
+        hit = _read_through.get(key)
+    if hit and now - hit["at"] < READ_THROUGH_SECONDS:
+        return hit["payload"]
+
+    payload = singleflight.do("read:" + ":".join(key), build)
+    with _read_through_lock:
+        _read_through.pop(key, None)
+        _read_through[key] = {"payload": payload, "at": time.time()}
+        while len(_read_through) > READ_THROUGH_MAX_ENTRIES:
+            del _read_through[next(iter(_read_through))]
+    return payload
+
+
+def read_games(date_espn: str, date_kp: str, sport: str = "cbb") -> dict:
+    """/games payload: today's CBB snapshot when available, otherwise a shared on-demand build."""
+    if sport == "cbb" and kp_date(date_kp) == kp_date(date_espn):
+        snap = snapshot("cbb", date_espn)
+        if snap is not None:
+            return snap
+    from services.build import build_games_for_date
+    return _read_through_build(("games", sport, date_espn, date_kp), lambda: build_games_for_date(date_espn, date_kp, sport))
+
+
+def read_mlb_games(date: str) -> list:
+    games = snapshot("mlb", date)
+    if games is not None:
+        return games
+    from services.mlb_espn import get_mlb_games
+    return _read_through_build(("mlb", date), lambda: get_mlb_games(date))
+
+
+def read_mlb_live_game(event_id: str) -> Optional[dict]:
+    """
+    /mlb/games/{event_id}/live: the game's live block from the slate it belongs to
+    (today's unless the event was seen on another date), read like /mlb/games, so it
+    never triggers more upstream work than the slate read itself. None if unknown.
+    """
+    from services.mlb_espn import event_date, live_view
+    eid = str(event_id)
+    for g in read_mlb_games(event_date(eid) or today_yyyymmdd_eastern()):
+        if str(g.get("id")) == eid:
+            return live_view(g)
+    return None
+
+
+def read_pga_leaderboard(date: Optional[str], limit: int) -> dict:
+    from services.pga_espn import get_pga_leaderboard, limit_leaderboard
+    if not date:
+        snap = snapshot("pga", today_yyyymmdd_eastern())
+        if snap is not None:
+            return limit_leaderboard(snap, limit)
+    return get_pga_leaderboard(date_yyyymmdd=date, limit=limit)
+
+
+def status() -> dict:
+    with _snapshots_lock:
+        items = list(_snapshots.items())
+    return {
+        "running": any(t.is_alive() for t in _threads),
+        "slates": [
+            {
+                "slate": slate,
+                "date": date,
+                "built_at": snap.get("built_at"),
+                "next_at": snap.get("next_at"),
+                "last_error": snap.get("last_error"),
+            }
+            for (slate, date), snap in items
+        ],
+    }
+
+
+def _refresh(slate: str, date: str) -> Optional[float]:
+    build, states = SLATES[slate]
+    key = (slate, date)
+    try:
+        payload = build(date)
+    except Exception as e:
+        now = time.time()
+        with _snapshots_lock:
+            snap = _snapshots.setdefault(key, {"payload": None, "built_at": None, "fresh_until": now})
+            snap["last_error"] = f"{type(e).__name__}: {e}"
+            snap["next_at"] = now + REFRESH_ERROR_SECONDS
+        return REFRESH_ERROR_SECONDS
+
+    now = time.time()
+    interval = next_interval(states(payload), now)
+    with _snapshots_lock:
+        # drop snapshots from previous days for this slate
+        for old in [k for k in _snapshots if k[0] == slate and k[1] != date]:
+            del _snapshots[old]
+        _snapshots[key] = {
+            "payload": payload,
+            "built_at": now,
+            "next_at": None if interval is None else now + interval,
+            "fresh_until": None if interval is None else now + interval + SNAPSHOT_GRACE_SECONDS,
+            "last_error": None,
+        }
+    return interval
+
+
+def _run(slate: str):
+    while not _stop.is_set():
+        date = today_yyyymmdd_eastern()
+        interval = _refresh(slate, date)
+        if interval is None:
+            # Everything is final: sleep until the Eastern date rolls over.
+            while not _stop.is_set() and today_yyyymmdd_eastern() == date:
+                _stop.wait(60)
+            continue
+        _stop.wait(interval)
+
+
+def start():
+    if any(t.is_alive() for t in _threads):
+        return
+    _stop.clear()
+    _threads.clear()
+    for slate in SLATES:
+        t = threading.Thread(target=_run, args=(slate,), name=f"slate-refresher-{slate}", daemon=True)
+        t.start()
+        _threads.append(t)
+
+
+def stop(timeout: float = 5.0):
+    _stop.set()
+    for t in _threads:
+        t.join(timeout)
+    _threads.clear()
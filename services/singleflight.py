@@ -0,0 +1,52 @@
+# services/singleflight.py
+"""
+Request coalescing for upstream fetches.
+
+Concurrent callers of do() with the same key share one execution of fn: the
+first caller runs it, everyone else waits and gets the same result (or the
+same exception). The entry is dropped as soon as the call finishes, so the
+table only ever holds keys that are in flight right now.
+"""
+import threading
+from typing import Any, Callable
+
+_calls: dict[str, "_Call"] = {}
+_calls_guard = threading.Lock()
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+def do(key: str, fn: Callable[[], Any]) -> Any:
+    with _calls_guard:
+        call = _calls.get(key)
+        if call is not None:
+            leader = False
+        else:
+            call = _Call()
+            _calls[key] = call
+            leader = True
+
+    if not leader:
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    try:
+        call.result = fn()
+    except BaseException as e:
+        call.error = e
+        raise
+    finally:
+        with _calls_guard:
+            _calls.pop(key, None)
+        call.done.set()
+    return call.result
+
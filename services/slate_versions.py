@@ -0,0 +1,89 @@
+# services/slate_versions.py
+"""
+Monotonic versions for slate snapshots, plus cheap deltas between them.
+
+Each (sport, date) keeps a short ring of recent versions, each with a per-game
+content fingerprint. stamp() hands out a new version only when some game's
+content actually changed; delta() answers "what changed since version N" by
+comparing two fingerprint maps instead of whole game objects.
+"""
+import hashlib
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+
+from utils import codec
+
+RING_SIZE = 60          # versions kept per (sport, date)
+MAX_SLATES = 32
+
+# Seeded from the clock so versions keep increasing across restarts.
+_seq = itertools.count(int(time.time() * 1000))
+
+# (sport, date) -> {"last_ref": list, "version": int, "ring": deque[(version, {game_id: fingerprint})]}
+_slates: dict[tuple[str, str], dict] = {}
+_lock = threading.Lock()
+
+
+def _fingerprint(game: Any) -> str:
+    raw = codec.dumps(game, sort_keys=True, default=str)
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _game_id(game: dict, id_field: str) -> str:
+    return str(game.get(id_field) or "")
+
+
+def stamp(sport: str, date: str, games: list[dict], id_field: str) -> int:
+    """Version for this games list; unchanged content keeps the current version."""
+    key = (sport, date)
+    with _lock:
+        st = _slates.get(key)
+        if st is not None and st["last_ref"] is games:
+            return st["version"]
+
+    fps = {_game_id(g, id_field): _fingerprint(g) for g in games}
+
+    with _lock:
+        st = _slates.get(key)
+        if st is None:
+            if len(_slates) >= MAX_SLATES:
+                _slates.pop(next(iter(_slates)))
+            st = _slates[key] = {"last_ref": None, "version": 0, "ring": deque(maxlen=RING_SIZE)}
+        if not st["ring"] or st["ring"][-1][1] != fps:
+            st["version"] = next(_seq)
+            st["ring"].append((st["version"], fps))
+        st["last_ref"] = games
+        return st["version"]
+
+
+def fingerprints(sport: str, date: str, games: list[dict], id_field: str) -> dict[str, str]:
+    """{game id: content fingerprint} for this games list, shared with stamp() so each snapshot is hashed once."""
+    version = stamp(sport, date, games, id_field)
+    with _lock:
+        st = _slates.get((sport, date)) or {}
+        fps = next((fps for v, fps in reversed(st.get("ring") or ()) if v == version), None)
+    if fps is not None:
+        return fps
+    return {_game_id(g, id_field): _fingerprint(g) for g in games}
+
+
+def delta(sport: str, date: str, games: list[dict], id_field: str, since: int) -> Optional[dict]:
+    """
+    {"version", "games": changed-or-new games, "removed": [game ids]} relative to `since`,
+    or None when `since` is no longer (or never was) in the ring and the client needs a full payload.
+    """
+    version = stamp(sport, date, games, id_field)
+    with _lock:
+        st = _slates.get((sport, date)) or {}
+        ring = list(st.get("ring") or [])
+    old = next((fps for v, fps in ring if v == since), None)
+    cur = next((fps for v, fps in ring if v == version), None)
+    if old is None or cur is None:
+        return None
+
+    changed = [g for g in games if old.get(_game_id(g, id_field)) != cur.get(_game_id(g, id_field))]
+    removed = [gid for gid in old if gid not in cur]
+    return {"version": version, "games": changed, "removed": removed}
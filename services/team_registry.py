@@ -0,0 +1,97 @@
+# services/team_registry.py
+"""
+ESPN team id -> KenPom team name.
+
+The merge in services/build.py learns pairs from every game it matches and
+records them here (table team_registry in the cache DB), so the next build can
+join on team ids instead of normalized names. static/team_id_overrides.json,
+shaped {"<espn team id>": "<KenPom name>"}, wins over anything learned; use it
+for teams whose names never normalize to the same string.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from services import cache_sqlite
+
+OVERRIDES_PATH = Path(__file__).resolve().parents[1] / "static" / "team_id_overrides.json"
+
+_ids: dict[str, str] = {}
+_overrides: dict[str, str] = {}
+_loaded = False
+_lock = threading.Lock()
+
+
+def _load_overrides() -> dict[str, str]:
+    try:
+        with OVERRIDES_PATH.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+    except Exception:
+        # fail-soft: a missing/bad file just means no overrides
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(k): v for k, v in data.items() if isinstance(v, str) and v}
+
+
+def _ensure_loaded():
+    global _loaded, _overrides
+    if _loaded:
+        return
+    with _lock:
+        if _loaded:
+            return
+        with cache_sqlite.connection() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS team_registry (
+                  espn_team_id  TEXT PRIMARY KEY,
+                  kp_name       TEXT NOT NULL,
+                  updated_at    INTEGER NOT NULL
+                );
+                """
+            )
+            rows = conn.execute("SELECT espn_team_id, kp_name FROM team_registry").fetchall()
+        _overrides = _load_overrides()
+        _ids.update(rows)
+        _ids.update(_overrides)
+        _loaded = True
+
+
+def kp_name(espn_team_id: Optional[str]) -> Optional[str]:
+    if not espn_team_id:
+        return None
+    _ensure_loaded()
+    return _ids.get(espn_team_id)
+
+
+def learn(pairs: dict[str, str]) -> int:
+    """Record espn_team_id -> KenPom name pairs from matched games. Returns how many changed."""
+    _ensure_loaded()
+    with _lock:
+        changed = {
+            tid: name for tid, name in pairs.items()
+            if tid and name and tid not in _overrides and _ids.get(tid) != name
+        }
+        if not changed:
+            return 0
+        _ids.update(changed)
+
+    now = int(time.time())
+    with cache_sqlite.connection() as conn:
+        conn.executemany(
+            """
+            INSERT INTO team_registry(espn_team_id, kp_name, updated_at) VALUES(?,?,?)
+            ON CONFLICT(espn_team_id) DO UPDATE SET kp_name=excluded.kp_name, updated_at=excluded.updated_at
+            """,
+            [(tid, name, now) for tid, name in changed.items()],
+        )
+    return len(changed)
+
+
+def stats() -> dict:
+    _ensure_loaded()
+    with _lock:
+        return {"teams": len(_ids), "overrides": len(_overrides)}
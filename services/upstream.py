@@ -0,0 +1,144 @@
+# services/upstream.py
+"""
+Shared HTTP client for every upstream call (ESPN, KenPom).
+
+One requests.Session with per-host keep-alive connection pools, so repeated
+calls (e.g. a dozen MLB summaries per poll) reuse TCP+TLS connections instead
+of opening new ones. GETs are retried with jittered exponential backoff on
+connection errors, timeouts and 429/5xx, and per-host latency is recorded for
+/debug/upstream.
+"""
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+UPSTREAM_POOL_HOSTS = int(os.getenv("UPSTREAM_POOL_HOSTS", "8"))          # host pools kept alive
+UPSTREAM_POOL_MAXSIZE = int(os.getenv("UPSTREAM_POOL_MAXSIZE", "16"))     # connections per host
+UPSTREAM_TIMEOUT = float(os.getenv("UPSTREAM_TIMEOUT", "15"))             # default seconds per attempt
+UPSTREAM_RETRIES = int(os.getenv("UPSTREAM_RETRIES", "2"))                # extra attempts after the first
+UPSTREAM_BACKOFF = float(os.getenv("UPSTREAM_BACKOFF", "0.25"))           # base backoff seconds
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+LATENCY_SAMPLES = 200
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+# host -> {"requests", "errors", "retries", "total_ms", "max_ms", "recent_ms": deque}
+_stats: dict[str, dict] = {}
+_stats_lock = threading.Lock()
+
+
+def session() -> requests.Session:
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=UPSTREAM_POOL_HOSTS,
+                    pool_maxsize=UPSTREAM_POOL_MAXSIZE,
+                    max_retries=0,  # retries are handled in get() so they show up in stats
+                )
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+                _session = s
+    return _session
+
+
+def close():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def _record(host: str, elapsed_ms: float, *, error: bool = False, retry: bool = False):
+    with _stats_lock:
+        st = _stats.get(host)
+        if st is None:
+            st = _stats[host] = {
+                "requests": 0, "errors": 0, "retries": 0, "total_ms": 0.0, "max_ms": 0.0,
+                "recent_ms": deque(maxlen=LATENCY_SAMPLES),
+            }
+        st["requests"] += 1
+        st["total_ms"] += elapsed_ms
+        st["max_ms"] = max(st["max_ms"], elapsed_ms)
+        st["recent_ms"].append(elapsed_ms)
+        if error:
+            st["errors"] += 1
+        if retry:
+            st["retries"] += 1
+
+
+def _backoff(attempt: int):
+    # "full jitter": uniform in [0, base * 2^attempt]
+    time.sleep(random.uniform(0, UPSTREAM_BACKOFF * (2 ** attempt)))
+
+
+def get(
+    url: str,
+    *,
+    params: Optional[dict[str, Any]] = None,
+    headers: Optional[dict[str, str]] = None,
+    timeout: Optional[float] = None,
+    retries: Optional[int] = None,
+) -> requests.Response:
+    """
+    Pooled GET with retry. Returns the final response (which may still be a non-2xx
+    status after retries are exhausted); raises the last requests exception otherwise.
+    """
+    host = urlsplit(url).netloc
+    timeout = UPSTREAM_TIMEOUT if timeout is None else timeout
+    attempts = 1 + (UPSTREAM_RETRIES if retries is None else max(0, retries))
+
+    for attempt in range(attempts):
+        last = attempt == attempts - 1
+        start = time.perf_counter()
+        try:
+            r = session().get(url, params=params, headers=headers, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            _record(host, (time.perf_counter() - start) * 1000, error=True, retry=not last)
+            if last:
+                raise
+            _backoff(attempt)
+            continue
+
+        retry = r.status_code in RETRY_STATUSES and not last
+        _record(host, (time.perf_counter() - start) * 1000, error=r.status_code >= 500, retry=retry)
+        if not retry:
+            return r
+        _backoff(attempt)
+
+    raise RuntimeError("unreachable")
+
+
+def _percentile(sorted_ms: list[float], q: float) -> Optional[float]:
+    if not sorted_ms:
+        return None
+    idx = min(len(sorted_ms) - 1, int(round(q * (len(sorted_ms) - 1))))
+    return round(sorted_ms[idx], 1)
+
+
+def stats() -> dict[str, dict]:
+    with _stats_lock:
+        items = [(host, dict(st), sorted(st["recent_ms"])) for host, st in _stats.items()]
+    out = {}
+    for host, st, recent in items:
+        out[host] = {
+            "requests": st["requests"],
+            "errors": st["errors"],
+            "retries": st["retries"],
+            "avg_ms": round(st["total_ms"] / st["requests"], 1) if st["requests"] else None,
+            "max_ms": round(st["max_ms"], 1),
+            "p50_ms": _percentile(recent, 0.50),
+            "p95_ms": _percentile(recent, 0.95),
+        }
+    return out
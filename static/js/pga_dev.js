@@ -123,6 +123,10 @@ function renderRows(leaderboard, selectedRound = 1) {
 
   const html = leaderboard.map((row) => {
     const pos = row.position == null ? "-" : row.position;
+    const moved = row.position_change || 0;
+    const moveHtml = moved
+      ? ` <span class="pos-move ${moved > 0 ? "pos-up" : "pos-down"}" title="${moved > 0 ? "Up" : "Down"} ${Math.abs(moved)}">${moved > 0 ? "▲" : "▼"}${Math.abs(moved)}</span>`
+      : "";
     const player = row.player?.name || "Unknown";
     const countryFlag = row.player?.country_flag || "";
     const holes = row.holes_completed == null ? "-" : row.holes_completed;
@@ -163,7 +167,7 @@ function renderRows(leaderboard, selectedRound = 1) {
 
     return `
       <tr class="${notStarted ? "not-started" : ""}">
-        <td data-label="Pos">${pos}</td>
+        <td data-label="Pos">${pos}${moveHtml}</td>
         <td data-label="Player"><span class="player-cell">${flagHtml}<span class="player-name">${player}</span></span></td>
         <td data-label="To Par" class="${scoreClass(toPar)}">${toPar}</td>
         <td data-label="Thru">${holes}</td>
@@ -42,6 +42,17 @@ const state = {
     updatedTimer: null,
     lastUpdatedMs: null,
   },
+
+  // Last slate version seen, so silent refreshes can ask for ?since=<version> deltas.
+  slateVersion: { key: "", version: null },
+
+  // Live push (SSE); polling is only the fallback when this is unavailable.
+  stream: {
+    source: null,
+    url: "",
+    opened: false,
+    failed: false,
+  },
 };
 
 // =====================================================
@@ -286,11 +297,117 @@ function clearTableForFullLoad() {
 }
 
 // =====================================================
-// Polling: live (3s) + idle (60s), silent refresh
+// Live push (SSE): snapshot on connect, then per-game changes
+// =====================================================
+function liveStreamUrl() {
+  if (state.stream.failed || typeof window.EventSource !== "function") return "";
+
+  const cur = yyyymmddFromDateInput($("datePicker")?.value || "");
+  if (!cur) return "";
+
+  if (state.sport === "mlb") return `/mlb/games/stream?date=${cur}`;
+  if (state.sport === "cbb" || state.sport === "cfb" || state.sport === "nfl") {
+    return `/games/stream?date_espn=${cur}&date_kp=${isoFromYYYYMMDD(cur)}&sport=${encodeURIComponent(state.sport)}`;
+  }
+  return "";
+}
+
+function closeLiveStream() {
+  if (state.stream.source) state.stream.source.close();
+  state.stream.source = null;
+  state.stream.url = "";
+  state.stream.opened = false;
+}
+
+function streamGameId(g) {
+  return state.sport === "mlb" ? String(g?.id || "") : String(g?.event_id || g?.key || "");
+}
+
+function applyStreamGames(games) {
+  if (state.sport === "mlb") {
+    state.mlbGames = enrichMlbLiveContext(state.mlbGames, games);
+    updateCountLine(state.mlbGames.length, state.mlbGames.length);
+    renderMlbCards(state.mlbGames);
+    if (!state.mlbGames.some((g) => isMlbLiveGame(g))) setPollingMode("idle");
+  } else {
+    state.games = games;
+    applySortAndRender();
+    const hasLive = state.games.some((g) => String(g.status_state || "").toLowerCase() === "in" || g.status === "live");
+    if (!hasLive) setPollingMode("idle");
+  }
+  setLastUpdatedNow();
+}
+
+function openLiveStream(url) {
+  if (state.stream.source && state.stream.url === url) return true;
+  closeLiveStream();
+
+  let es;
+  try {
+    es = new EventSource(url);
+  } catch {
+    state.stream.failed = true;
+    return false;
+  }
+  state.stream.source = es;
+  state.stream.url = url;
+
+  const parse = (ev) => {
+    try {
+      return JSON.parse(ev.data);
+    } catch {
+      return null;
+    }
+  };
+  const currentGames = () => (state.sport === "mlb" ? state.mlbGames : state.games) || [];
+
+  es.addEventListener("snapshot", (ev) => {
+    const data = parse(ev);
+    if (!data || es !== state.stream.source) return;
+    state.stream.opened = true;
+    applyStreamGames(Array.isArray(data.games) ? data.games : []);
+  });
+
+  es.addEventListener("game", (ev) => {
+    const game = parse(ev);
+    if (!game || es !== state.stream.source) return;
+    const id = streamGameId(game);
+    const games = currentGames().slice();
+    const idx = games.findIndex((g) => streamGameId(g) === id);
+    if (idx >= 0) games[idx] = game;
+    else games.push(game);
+    applyStreamGames(games);
+  });
+
+  es.addEventListener("remove", (ev) => {
+    const data = parse(ev);
+    if (!data || es !== state.stream.source) return;
+    applyStreamGames(currentGames().filter((g) => streamGameId(g) !== String(data.id)));
+  });
+
+  es.onerror = () => {
+    if (es !== state.stream.source) return;
+    // EventSource reconnects on its own once a stream has worked; only fall back
+    // to polling when the endpoint never delivered or the browser gave up.
+    if (!state.stream.opened || es.readyState === EventSource.CLOSED) {
+      closeLiveStream();
+      state.stream.failed = true;
+      setPollingMode("live");
+    }
+  };
+
+  return true;
+}
+
+// =====================================================
+// Polling: live (SSE, else 3s) + idle (60s), silent refresh
 // =====================================================
 function setPollingMode(mode) {
   // mode: "live" | "idle" | "off"
 
+  const streamUrl = mode === "live" ? liveStreamUrl() : "";
+  if (state.stream.source && state.stream.url !== streamUrl) closeLiveStream();
+
   // clear everything first
   if (state.timers.livePollTimer) {
     clearInterval(state.timers.livePollTimer);
@@ -301,7 +418,8 @@ function setPollingMode(mode) {
     state.timers.idlePollTimer = null;
   }
 
-  const poll = (ms) => {
+  const poll = (ms, liveOnly = false) => {
+    let ticks = 0;
     return setInterval(async () => {
       if (state.timers.pollInFlight) return;
       state.timers.pollInFlight = true;
@@ -309,6 +427,10 @@ function setPollingMode(mode) {
       setLastUpdatedNow();
       const cur = yyyymmddFromDateInput($("datePicker")?.value || "");
       try {
+        // Live-only mode: poll just the in-progress games, with a periodic full
+        // slate load to pick up games that start (pre -> in).
+        ticks += 1;
+        if (liveOnly && ticks % MLB_FULL_POLL_EVERY !== 0 && (await refreshMlbLiveGames())) return;
         await loadGames(cur, true); // silent refresh
       } finally {
         state.timers.pollInFlight = false;
@@ -317,7 +439,8 @@ function setPollingMode(mode) {
   };
 
   if (mode === "live") {
-    state.timers.livePollTimer = poll(3000);
+    if (streamUrl && openLiveStream(streamUrl)) return;
+    state.timers.livePollTimer = poll(3000, state.sport === "mlb");
     return;
   }
 
@@ -1867,40 +1990,145 @@ function wireFilters() {
 // =====================================================
 async function fetchEspnUrls(date_espn, sport = "cbb") {
   try {
-    const resp = await fetchWithTimeout(`/urls/espn?date_espn=${date_espn}&sport=${encodeURIComponent(sport)}`);
-    const data = await resp.json();
-    return (resp.ok && data.urls_by_event_id) ? data.urls_by_event_id : {};
+    const url = `/urls/espn?date_espn=${date_espn}&sport=${encodeURIComponent(sport)}`;
+    const resp = await fetchWithTimeout(url);
+    const { data, notModified } = await readJsonWithValidator(url, resp);
+    return ((resp.ok || notModified) && data.urls_by_event_id) ? data.urls_by_event_id : {};
   } catch {
     return {};
   }
 }
 
+// Conditional GETs: last ETag + parsed body per URL, so unchanged polls are a header-only 304.
+const validatorCache = new Map();
+const VALIDATOR_CACHE_MAX = 50;
+
 async function fetchWithTimeout(url, timeoutMs = 15000) {
   const controller = new AbortController();
   const timeoutId = setTimeout(() => controller.abort(), timeoutMs);
+  const headers = {};
+  const cached = validatorCache.get(url);
+  if (cached?.etag) headers["If-None-Match"] = cached.etag;
   try {
-    return await fetch(url, { signal: controller.signal, cache: "no-store" });
+    return await fetch(url, { signal: controller.signal, cache: "no-store", headers });
   } finally {
     clearTimeout(timeoutId);
   }
 }
 
-async function fetchGames(date_espn, date_kp, sport = "cbb") {
-  const url = `/games?date_espn=${date_espn}&date_kp=${date_kp}&sport=${encodeURIComponent(sport)}`;
-  const resp = await fetchWithTimeout(url);
+async function readJsonWithValidator(url, resp) {
+  if (resp.status === 304 && validatorCache.has(url)) {
+    return { data: validatorCache.get(url).data, notModified: true };
+  }
+
   let data = {};
   try {
     data = await resp.json();
   } catch {
     data = {};
   }
-  return { resp, data };
+
+  const etag = resp.headers.get("ETag");
+  if (resp.ok && etag) {
+    validatorCache.delete(url);
+    if (validatorCache.size >= VALIDATOR_CACHE_MAX) {
+      validatorCache.delete(validatorCache.keys().next().value);
+    }
+    validatorCache.set(url, { etag, data });
+  }
+  return { data, notModified: false };
+}
+
+async function fetchGames(date_espn, date_kp, sport = "cbb", since = null) {
+  let url = `/games?date_espn=${date_espn}&date_kp=${date_kp}&sport=${encodeURIComponent(sport)}`;
+  if (since !== null && since !== undefined) url += `&since=${since}`;
+  const resp = await fetchWithTimeout(url);
+  const { data, notModified } = await readJsonWithValidator(url, resp);
+  return { resp, data, notModified };
+}
+
+// Per-game live polling for MLB: /mlb/games/{id}/live for "in" games only.
+const MLB_FULL_POLL_EVERY = 10; // every Nth live tick reloads the whole slate
+
+async function fetchMlbLive(eventId) {
+  const url = `/mlb/games/${encodeURIComponent(eventId)}/live`;
+  const resp = await fetchWithTimeout(url);
+  const { data, notModified } = await readJsonWithValidator(url, resp);
+  return { resp, data, notModified };
+}
+
+// Returns false when the caller should fall back to a full slate load
+// (nothing live, a request failed, or a game left "in").
+async function refreshMlbLiveGames() {
+  const prevGames = state.mlbGames || [];
+  const liveIds = prevGames.filter((g) => isMlbLiveGame(g) && g?.id).map((g) => String(g.id));
+  if (!liveIds.length) return false;
+
+  let results;
+  try {
+    results = await Promise.all(liveIds.map((id) => fetchMlbLive(id)));
+  } catch {
+    return false;
+  }
+  if (results.some(({ resp, notModified }) => !resp.ok && !notModified)) return false;
+
+  const liveById = new Map(results.map(({ data }) => [String(data?.id || ""), data]));
+  if ([...liveById.values()].some((d) => String(d?.state || "").toLowerCase() !== "in")) return false;
+  if (results.every(({ notModified }) => notModified)) return true;
+
+  const nextGames = prevGames.map((g) => {
+    const upd = liveById.get(String(g?.id || ""));
+    if (!upd) return g;
+    return {
+      ...g,
+      state: upd.state,
+      status: upd.status,
+      live: upd.live,
+      home: { ...(g.home || {}), score: upd.home?.score ?? g.home?.score },
+      away: { ...(g.away || {}), score: upd.away?.score ?? g.away?.score },
+    };
+  });
+
+  state.mlbGames = enrichMlbLiveContext(prevGames, nextGames);
+  renderMlbCards(state.mlbGames);
+  setLastUpdatedNow();
+  return true;
+}
+
+async function fetchMlbGames(date_yyyymmdd, since = null) {
+  let url = `/mlb/games?date=${date_yyyymmdd}`;
+  if (since !== null && since !== undefined) url += `&since=${since}`;
+  const resp = await fetchWithTimeout(url);
+  const { data, notModified } = await readJsonWithValidator(url, resp);
+  return { resp, data, notModified };
+}
+
+// =====================================================
+// Versioned deltas (?since=<version>)
+// =====================================================
+function sinceForSlate(key, silent) {
+  return silent && state.slateVersion.key === key ? state.slateVersion.version : null;
 }
 
-async function fetchMlbGames(date_yyyymmdd) {
-  const resp = await fetchWithTimeout(`/mlb/games?date=${date_yyyymmdd}`);
-  const data = await resp.json();
-  return { resp, data };
+function rememberSlateVersion(key, data) {
+  state.slateVersion = { key, version: data?.version ?? null };
+}
+
+function mergeDeltaGames(prevGames, data, idOf) {
+  // Full payloads (no "delta" flag) replace the slate outright.
+  if (!data?.delta) return Array.isArray(data?.games) ? data.games : [];
+
+  const removed = new Set((data.removed || []).map(String));
+  const changed = new Map((data.games || []).map((g) => [idOf(g), g]));
+  const out = [];
+  for (const g of prevGames || []) {
+    const id = idOf(g);
+    if (removed.has(id)) continue;
+    out.push(changed.get(id) || g);
+    changed.delete(id);
+  }
+  for (const g of changed.values()) out.push(g);
+  return out;
 }
 
 // =====================================================
@@ -1938,21 +2166,27 @@ async function loadGames(yyyymmdd = null, silent = false) {
   if (state.sport === "mlb") {
     state.urlsByEventId = {};
     const prevMlbGames = state.mlbGames || [];
+    const versionKey = `mlb:${date_espn}`;
 
-    let resp, data;
+    let resp, data, notModified;
     try {
-      ({ resp, data } = await fetchMlbGames(date_espn));
+      ({ resp, data, notModified } = await fetchMlbGames(date_espn, sinceForSlate(versionKey, silent)));
     } catch (e) {
       if (!silent) showError(e);
       return;
     }
 
-    if (!resp.ok) {
+    // Nothing changed since the last poll: keep what is on screen.
+    if (notModified && silent) return;
+
+    if (!resp.ok && !notModified) {
       if (!silent) showError(JSON.stringify(data, null, 2));
       return;
     }
 
-    state.mlbGames = enrichMlbLiveContext(prevMlbGames, data.games || []);
+    const nextMlbGames = mergeDeltaGames(prevMlbGames, data, (g) => String(g?.id || ""));
+    rememberSlateVersion(versionKey, data);
+    state.mlbGames = enrichMlbLiveContext(prevMlbGames, nextMlbGames);
 
     // MLB doesn't use KP future mode styling, but does share polling behavior.
     document.documentElement.classList.remove("future");
@@ -1971,21 +2205,26 @@ async function loadGames(yyyymmdd = null, silent = false) {
   if (state.sport === "cbb" || state.sport === "cfb" || state.sport === "nfl") {
     // URLs for external deep-links via ESPN as available.
     state.urlsByEventId = await fetchEspnUrls(date_espn, state.sport);
+    const versionKey = `${state.sport}:${date_espn}:${date_kp}`;
 
-    let resp, data;
+    let resp, data, notModified;
     try {
-      ({ resp, data } = await fetchGames(date_espn, date_kp, state.sport));
+      ({ resp, data, notModified } = await fetchGames(date_espn, date_kp, state.sport, sinceForSlate(versionKey, silent)));
     } catch (e) {
       showError(e);
       return;
     }
 
-    if (!resp.ok) {
+    // Nothing changed since the last poll: keep what is on screen.
+    if (notModified && silent) return;
+
+    if (!resp.ok && !notModified) {
       showError(JSON.stringify(data, null, 2));
       return;
     }
 
-    state.games = Array.isArray(data.games) ? data.games : [];
+    state.games = mergeDeltaGames(state.games, data, (g) => String(g?.event_id || ""));
+    rememberSlateVersion(versionKey, data);
 
     // Future date mode (drives future-day rendering + CSS)
     const isFuture = data.mode === "future";
@@ -2009,15 +2248,15 @@ async function loadGames(yyyymmdd = null, silent = false) {
   // ---------------------------
   state.urlsByEventId = await fetchEspnUrls(date_espn);
 
-  let resp, data;
+  let resp, data, notModified;
   try {
-    ({ resp, data } = await fetchGames(date_espn, date_kp));
+    ({ resp, data, notModified } = await fetchGames(date_espn, date_kp));
   } catch (e) {
     showError(e);
     return;
   }
 
-  if (!resp.ok) {
+  if (!resp.ok && !notModified) {
     showError(JSON.stringify(data, null, 2));
     return;
   }
@@ -0,0 +1,43 @@
+# utils/codec.py
+"""
+JSON codec used for upstream bodies, cache storage and API responses.
+
+Uses orjson when it is installed and falls back to the stdlib json module
+otherwise. Output is compact UTF-8 either way; dict keys that are not strings
+(e.g. PGA round numbers) are stringified the same way json.dumps does.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, sort_keys: bool = False, default=None) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option, default=default)
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys, default=default
+    ).encode("utf-8")
+
+
+def dumps_str(obj: Any, *, sort_keys: bool = False, default=None) -> str:
+    return dumps(obj, sort_keys=sort_keys, default=default).decode("utf-8")
+
+
+def response_json(response) -> Any:
+    """Decode a requests.Response body (replacement for response.json())."""
+    return loads(response.content)
@@ -0,0 +1,72 @@
+# utils/etag.py
+"""
+Strong ETags for JSON endpoints.
+
+The ETag is a hash of the exact response body. The last encoding per URL is
+remembered together with the payload's top-level values, so re-serving the same
+snapshot object skips JSON encoding entirely; a matching If-None-Match then
+costs a header-only 304.
+"""
+import hashlib
+import threading
+from typing import Any
+
+from fastapi import Request, Response
+
+from utils import codec
+
+MAX_MEMO_ENTRIES = 256
+
+# url -> (top-level payload values, body bytes, etag)
+_memo: dict[str, tuple[dict, bytes, str]] = {}
+_memo_lock = threading.Lock()
+
+
+def _same_shallow(prev: dict, payload: dict) -> bool:
+    if prev.keys() != payload.keys():
+        return False
+    for k, v in payload.items():
+        old = prev[k]
+        if old is v:
+            continue
+        if isinstance(v, (dict, list)) or old != v:
+            return False
+    return True
+
+
+def encode(url: str, payload: Any) -> tuple[bytes, str]:
+    if isinstance(payload, dict):
+        with _memo_lock:
+            hit = _memo.get(url)
+        if hit and _same_shallow(hit[0], payload):
+            return hit[1], hit[2]
+
+    body = codec.dumps(payload)
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+    if isinstance(payload, dict):
+        with _memo_lock:
+            _memo.pop(url, None)
+            if len(_memo) >= MAX_MEMO_ENTRIES:
+                _memo.pop(next(iter(_memo)))
+            _memo[url] = (dict(payload), body, etag)
+    return body, etag
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def json_response(request: Request, payload: Any) -> Response:
+    """200 with body + ETag, or 304 when the client's If-None-Match already has this body."""
+    body, etag = encode(str(request.url), payload)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)